@@ -4,12 +4,14 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import threading
 from pathlib import Path
-from typing import Any
+from typing import Any, Coroutine
 
 from forge_core.context import ExecutionContext
 from forge_core.plugin import ResultStatus, ToolParam, ToolPlugin, ToolResult
 
+from doc_suggester.semantic_cache import SuggestionCache
 from doc_suggester.suggester import suggest
 
 _DEFAULT_DATA_DIR = str(Path.home() / ".local" / "share" / "doc-suggester")
@@ -21,6 +23,26 @@ class DocSuggesterPlugin:
     version = "0.1.0"
     requires_auth = False  # uses ANTHROPIC_API_KEY, not chainctl
 
+    def __init__(self) -> None:
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def _run_async(self, coro: Coroutine[Any, Any, str]) -> str:
+        """Run a coroutine on the plugin's persistent event loop.
+
+        asyncio.run would create and tear down a loop per invocation — and
+        raises outright if the Forge host already has a loop running on this
+        thread. A dedicated loop on a daemon thread sidesteps both, and lets
+        loop-bound state (HTTP connection pools) survive across runs.
+        """
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=self._loop.run_forever,
+                name="doc-suggester-loop",
+                daemon=True,
+            ).start()
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
     def get_params(self) -> list[ToolParam]:
         return [
             ToolParam(
@@ -40,6 +62,12 @@ class DocSuggesterPlugin:
                 type="bool",
                 default=False,
             ),
+            ToolParam(
+                name="no_cache",
+                description="Skip the on-disk suggestion cache",
+                type="bool",
+                default=False,
+            ),
             ToolParam(
                 name="project_root",
                 description=f"Path to the doc-suggester data directory (default: {_DEFAULT_DATA_DIR})",
@@ -58,20 +86,39 @@ class DocSuggesterPlugin:
         project_root = Path(raw_root) if raw_root else Path(_DEFAULT_DATA_DIR)
         project_root.mkdir(parents=True, exist_ok=True)
 
+        cache = None
+        if not args.get("no_cache", False):
+            cache = SuggestionCache(project_root)
+            if args.get("refresh", False):
+                cache.clear()
+            else:
+                cached = cache.get(args["notes"], args.get("format", "md"))
+                if cached is not None:
+                    print(cached)
+                    ctx.progress(1.0, "Done (cached)")
+                    return ToolResult(
+                        status=ResultStatus.SUCCESS,
+                        summary="Recommendations served from cache",
+                        data={"output": cached},
+                    )
+
         ctx.progress(0.1, "Running analysis...")
         try:
-            result = asyncio.run(
+            result = self._run_async(
                 suggest(
                     se_notes=args["notes"],
                     project_root=project_root,
                     force_refresh=args.get("refresh", False),
                     output_format=args.get("format", "md"),
+                    use_cache=not args.get("no_cache", False),
                 )
             )
         except Exception as e:
             logging.exception("doc-suggester failed")
             return ToolResult(status=ResultStatus.FAILURE, summary=f"Error: {e}")
 
+        if cache is not None:
+            cache.put(args["notes"], args.get("format", "md"), result)
         print(result)
         ctx.progress(1.0, "Done")
         return ToolResult(
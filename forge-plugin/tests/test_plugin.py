@@ -59,7 +59,7 @@ def test_run_cancelled_before_start():
 def test_run_success(capsys):
     with patch("forge_doc_suggester.plugin.suggest", new_callable=AsyncMock) as mock_suggest:
         mock_suggest.return_value = "## Recommendations"
-        result = DocSuggesterPlugin().run({"notes": "Java CVEs"}, _make_ctx())
+        result = DocSuggesterPlugin().run({"notes": "Java CVEs", "no_cache": True}, _make_ctx())
     assert result.status == ResultStatus.SUCCESS
     assert result.data["output"] == "## Recommendations"
     assert "## Recommendations" in capsys.readouterr().out
@@ -74,6 +74,7 @@ def test_run_passes_correct_args(tmp_path: Path):
                 "format": "email",
                 "refresh": True,
                 "project_root": tmp_path,
+                "no_cache": True,
             },
             _make_ctx(),
         )
@@ -82,19 +83,46 @@ def test_run_passes_correct_args(tmp_path: Path):
         project_root=tmp_path,
         force_refresh=True,
         output_format="email",
+        use_cache=False,
     )
 
 
 def test_run_project_root_default():
     with patch("forge_doc_suggester.plugin.suggest", new_callable=AsyncMock) as mock_suggest:
         mock_suggest.return_value = "output"
-        DocSuggesterPlugin().run({"notes": "test"}, _make_ctx())
+        DocSuggesterPlugin().run({"notes": "test", "no_cache": True}, _make_ctx())
     assert mock_suggest.call_args.kwargs["project_root"] == Path(_DEFAULT_DATA_DIR)
 
 
+def test_run_serves_second_call_from_cache(tmp_path: Path):
+    """A repeat run with the same notes hits the cache without calling suggest."""
+    with patch("forge_doc_suggester.plugin.suggest", new_callable=AsyncMock) as mock_suggest:
+        mock_suggest.return_value = "## Recommendations"
+        args = {"notes": "Java CVEs", "project_root": tmp_path}
+        DocSuggesterPlugin().run(args, _make_ctx())
+        second = DocSuggesterPlugin().run(args, _make_ctx())
+    mock_suggest.assert_called_once()
+    assert second.status == ResultStatus.SUCCESS
+    assert second.summary == "Recommendations served from cache"
+    assert second.data["output"] == "## Recommendations"
+
+
+def test_run_refresh_clears_cache(tmp_path: Path):
+    """refresh=True drops cached entries, reruns, and re-caches the fresh result."""
+    with patch("forge_doc_suggester.plugin.suggest", new_callable=AsyncMock) as mock_suggest:
+        mock_suggest.return_value = "output"
+        args = {"notes": "Java CVEs", "project_root": tmp_path}
+        DocSuggesterPlugin().run(args, _make_ctx())
+        DocSuggesterPlugin().run({**args, "refresh": True}, _make_ctx())
+        third = DocSuggesterPlugin().run(args, _make_ctx())
+    # First run and the refresh run hit the API; the third replays the re-cached result.
+    assert mock_suggest.call_count == 2
+    assert third.summary == "Recommendations served from cache"
+
+
 def test_run_failure_on_exception():
     with patch("forge_doc_suggester.plugin.suggest", new_callable=AsyncMock) as mock_suggest:
         mock_suggest.side_effect = RuntimeError("API down")
-        result = DocSuggesterPlugin().run({"notes": "test"}, _make_ctx())
+        result = DocSuggesterPlugin().run({"notes": "test", "no_cache": True}, _make_ctx())
     assert result.status == ResultStatus.FAILURE
     assert "API down" in result.summary
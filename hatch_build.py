@@ -4,10 +4,14 @@ from __future__ import annotations
 
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from hatchling.builders.hooks.plugin.interface import BuildHookInterface
 
+# -trimpath and stripped symbols keep the bundled binaries small.
+_GO_FLAGS = ["-trimpath", "-ldflags=-s -w"]
+
 
 class CustomBuildHook(BuildHookInterface):
     PLUGIN_NAME = "custom"
@@ -17,26 +21,27 @@ class CustomBuildHook(BuildHookInterface):
         bin_dir = root / "src" / "doc_suggester" / "bin"
         bin_dir.mkdir(parents=True, exist_ok=True)
 
-        binary_name = "scraper.exe" if sys.platform == "win32" else "scraper"
-        output = bin_dir / binary_name
-
-        print(f"[hatch-build] Compiling Go scraper → {output}")
-        subprocess.run(
-            ["go", "build", "-o", str(output), "."],
-            cwd=root,
-            check=True,
-        )
-
-        # Mark as an artifact so hatchling includes it even though it's gitignored
-        build_data["artifacts"].append(f"src/doc_suggester/bin/{binary_name}")
-
-        # Build llgen binary
-        llgen_name = "llgen.exe" if sys.platform == "win32" else "llgen"
-        llgen_output = bin_dir / llgen_name
-        print(f"[hatch-build] Compiling Go llgen → {llgen_output}")
-        subprocess.run(
-            ["go", "build", "-o", str(llgen_output), "."],
-            cwd=root / "llgen",
-            check=True,
-        )
-        build_data["artifacts"].append(f"src/doc_suggester/bin/{llgen_name}")
+        ext = ".exe" if sys.platform == "win32" else ""
+        builds = [
+            ("scraper" + ext, root),
+            ("llgen" + ext, root / "llgen"),
+        ]
+
+        # The two Go builds are independent — run them concurrently.
+        with ThreadPoolExecutor(max_workers=len(builds)) as executor:
+            futures = []
+            for binary_name, cwd in builds:
+                output = bin_dir / binary_name
+                print(f"[hatch-build] Compiling Go {binary_name} → {output}")
+                futures.append(executor.submit(
+                    subprocess.run,
+                    ["go", "build", *_GO_FLAGS, "-o", str(output), "."],
+                    cwd=cwd,
+                    check=True,
+                ))
+            for future in futures:
+                future.result()
+
+        # Mark as artifacts so hatchling includes them even though they're gitignored
+        for binary_name, _ in builds:
+            build_data["artifacts"].append(f"src/doc_suggester/bin/{binary_name}")
@@ -2,15 +2,31 @@
 
 from __future__ import annotations
 
-import json
+import calendar
+import functools
 import logging
+import mmap
+import os
+import pickle
 import re
 import subprocess
 import sys
+import time
+from collections.abc import Iterator
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 
+from doc_suggester import _json
+
+try:  # Optional: stream-parse large checkpoints without materializing the dict
+    import ijson
+
+    _CHECKPOINT_ERRORS: tuple[type[Exception], ...] = (ValueError, OSError, ijson.JSONError)
+except ImportError:
+    ijson = None
+    _CHECKPOINT_ERRORS = (ValueError, OSError)
+
 logger = logging.getLogger(__name__)
 
 
@@ -19,33 +35,65 @@ class BlogPost:
     title: str
     url: str
     date: str
-    excerpt: str
     full_content: str
 
+    @property
+    def excerpt(self) -> str:
+        """First 300 characters of the post, derived on demand.
+
+        Computed rather than stored so large archives don't duplicate the
+        head of every post in memory and in the parse cache.
+        """
+        return self.full_content[:300]
+
 
 _STALE_DAYS = 7
 
-# Matches archive entries: ## Title\n\n*Source: URL | Date*\n\nContent\n\n---
-_ENTRY_RE = re.compile(
-    r"^## (.+?)\n\n\*Source: (https?://[^\s|]+?)(?:\s*\|\s*([^\*]+))?\*\n\n([\s\S]*?)(?=\n\n---)",
+# Sentinel for "no parseable date" in the max() reduction below.
+_EPOCH = datetime.min.replace(tzinfo=timezone.utc)
+
+# Archive entries look like: ## Title\n\n*Source: URL | Date*\n\nContent\n\n---
+# The archive is first cut on the literal separator (a C-level scan), then each
+# block is matched with a small bytes-mode regex — no lazy quantifier has to
+# backtrack across the whole file.
+_ENTRY_SEP = b"\n\n---"
+_BLOCK_RE = re.compile(
+    rb"^## (.+?)\n\n\*Source: (https?://[^\s|]+?)(?:\s*\|\s*([^\*]+))?\*\n\n([\s\S]*)",
     re.MULTILINE,
 )
 
-_DATE_FORMATS = [
-    "%B %d, %Y",   # January 05, 2024
-    "%B %-d, %Y",  # January 5, 2024 (Linux strptime)
-    "%B %d %Y",    # January 05 2024
-]
+# Matches "January 5, 2024", "January 05, 2024", and "January 5 2024"
+_TEXT_DATE_RE = re.compile(r"^([A-Za-z]+)\s+(\d{1,2}),?\s+(\d{4})$")
+# Casefolded keys: strptime's %B was case-insensitive, and the scraper's
+# fallback path can emit lowercase month names from raw <time> text.
+_MONTHS = {name.casefold(): i for i, name in enumerate(calendar.month_name) if name}
 
 
+@functools.lru_cache(maxsize=4096)
 def _parse_date(date_str: str) -> datetime | None:
-    """Parse a date string like 'January 5, 2024' into a datetime."""
+    """Parse a date string like 'January 5, 2024' into a datetime.
+
+    Cached: checkpoints repeat the same handful of date strings across many
+    entries, and long-lived processes re-parse the same checkpoint repeatedly.
+    """
     date_str = date_str.strip()
-    for fmt in _DATE_FORMATS:
+    # Manual YYYY-MM-DD scan: three int() calls beat fromisoformat's grammar.
+    if len(date_str) == 10 and date_str[4] == "-" and date_str[7] == "-":
+        try:
+            return datetime(
+                int(date_str[:4]), int(date_str[5:7]), int(date_str[8:10]), tzinfo=timezone.utc
+            )
+        except ValueError:
+            return None
+    match = _TEXT_DATE_RE.match(date_str)
+    if match:
+        month = _MONTHS.get(match.group(1).casefold())
+        if month is None:
+            return None
         try:
-            return datetime.strptime(date_str, fmt).replace(tzinfo=timezone.utc)
+            return datetime(int(match.group(3)), month, int(match.group(2)), tzinfo=timezone.utc)
         except ValueError:
-            continue
+            return None
     # Also try ISO format (Go scraper may emit YYYY-MM-DD)
     try:
         return datetime.fromisoformat(date_str).replace(tzinfo=timezone.utc)
@@ -53,25 +101,56 @@ def _parse_date(date_str: str) -> datetime | None:
         return None
 
 
+def _iter_checkpoint_dates(checkpoint_path: Path) -> Iterator[str]:
+    """Yield the raw date string of each checkpoint entry.
+
+    Uses ijson when available so multi-megabyte checkpoints stream in
+    constant memory; falls back to a full json.loads otherwise.
+    """
+    if ijson is not None:
+        with open(checkpoint_path, "rb") as f:
+            for _, entry in ijson.kvitems(f, ""):
+                yield entry.get("date", "")
+    else:
+        # read_bytes + a bytes-accepting loads skips the separate UTF-8 decode
+        data: dict = _json.loads(checkpoint_path.read_bytes())
+        for entry in data.values():
+            yield entry.get("date", "")
+
+
+# Reduction results keyed by checkpoint stat: the streaming parse never
+# materializes the checkpoint dict, so the cheap thing to cache is the answer.
+_RECENT_DATE_CACHE: dict[Path, tuple[int, int, datetime | None]] = {}
+
+
 def get_most_recent_blog_date(project_root: Path) -> datetime | None:
-    """Return the most recent blog post date from checkpoint.json, or None."""
+    """Return the most recent blog post date from checkpoint.json, or None.
+
+    Repeat calls against an unchanged checkpoint cost one stat.
+    """
     checkpoint_path = project_root / "output" / "checkpoint.json"
-    if not checkpoint_path.exists():
-        return None
     try:
-        data: dict = json.loads(checkpoint_path.read_text())
-    except (json.JSONDecodeError, OSError):
+        st = checkpoint_path.stat()
+    except FileNotFoundError:
         return None
 
-    most_recent: datetime | None = None
-    for entry in data.values():
-        raw_date = entry.get("date", "")
-        if not raw_date:
-            continue
-        parsed = _parse_date(raw_date)
-        if parsed and (most_recent is None or parsed > most_recent):
-            most_recent = parsed
-    return most_recent
+    cached = _RECENT_DATE_CACHE.get(checkpoint_path)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+
+    try:
+        # Many entries share a publication date, so reduce over the unique
+        # strings — one parse and one comparison per distinct date.
+        unique_dates = {raw for raw in _iter_checkpoint_dates(checkpoint_path) if raw}
+    except _CHECKPOINT_ERRORS:
+        return None
+    most_recent = max(
+        (_parse_date(raw) or _EPOCH for raw in unique_dates),
+        default=_EPOCH,
+    )
+    result = None if most_recent == _EPOCH else most_recent
+    _RECENT_DATE_CACHE[checkpoint_path] = (st.st_mtime_ns, st.st_size, result)
+    return result
 
 
 def is_archive_stale(project_root: Path) -> bool:
@@ -82,27 +161,34 @@ def is_archive_stale(project_root: Path) -> bool:
     most_recent = get_most_recent_blog_date(project_root)
     if most_recent is None:
         return True
-    age = datetime.now(timezone.utc) - most_recent
-    return age.days > _STALE_DAYS
+    # Raw epoch arithmetic, mirroring labs_manager.is_labs_stale.
+    return time.time() - most_recent.timestamp() > _STALE_DAYS * 86400
 
 
-def _find_scraper() -> list[str]:
+@functools.lru_cache(maxsize=1)
+def _find_scraper() -> tuple[str, ...]:
     """Return the command to invoke the Go scraper.
 
     Prefers the binary bundled at install time. Falls back to `go run main.go`
-    for development (uv run / editable install).
+    for development (uv run / editable install). Cached so long-lived processes
+    don't repeat the stat/chmod on every refresh.
     """
     binary_name = "scraper.exe" if sys.platform == "win32" else "scraper"
     bundled = Path(__file__).parent / "bin" / binary_name
     if bundled.exists():
-        bundled.chmod(0o755)
-        return [str(bundled)]
-    return ["go", "run", "main.go"]
+        st = bundled.stat()
+        if not st.st_mode & 0o111:
+            try:
+                bundled.chmod(st.st_mode | 0o755)
+            except OSError:
+                pass  # read-only install (EROFS/EACCES): the run itself will surface it
+        return (str(bundled),)
+    return ("go", "run", "main.go")
 
 
 def refresh_blogs(project_root: Path, force: bool = False) -> None:
     """Run the Go scraper to refresh the blog archive."""
-    cmd = _find_scraper()
+    cmd = list(_find_scraper())
     if force:
         cmd.append("-force")
     logger.debug("Running scraper in %s: %s", project_root, cmd)
@@ -110,20 +196,90 @@ def refresh_blogs(project_root: Path, force: bool = False) -> None:
     subprocess.run(cmd, cwd=project_root, check=True, stdout=sink, stderr=sink)
 
 
+def iter_blog_index(archive_path: Path) -> Iterator[BlogPost]:
+    """Lazily yield BlogPost objects from unchained-archive.md.
+
+    The archive is mmap'd and scanned with a bytes-mode regex, so memory is
+    paged in on demand and only the matched groups are UTF-8 decoded. Callers
+    that only need the first N posts can stop early without paying for the rest.
+    """
+    if not archive_path.exists() or archive_path.stat().st_size == 0:
+        return
+
+    with open(archive_path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            start = 0
+            size = len(mm)
+            while start < size:
+                end = mm.find(_ENTRY_SEP, start)
+                if end == -1:
+                    break  # entries must be terminated by a separator
+                match = _BLOCK_RE.search(mm[start:end])
+                start = end + len(_ENTRY_SEP)
+                if match is None:
+                    continue
+                # Strip in the bytes domain so each field is decoded exactly
+                # once, with no second full-string copy from str.strip.
+                title = match.group(1).strip().decode("utf-8")
+                url = match.group(2).strip().decode("utf-8")
+                date = (match.group(3) or b"").strip().decode("utf-8")
+                full_content = match.group(4).strip().decode("utf-8")
+                yield BlogPost(title=title, url=url, date=date, full_content=full_content)
+
+
+# In-memory layer over the pickle cache: warm calls in one process return
+# the same list object, which lets post_index reuse its derived mapping.
+_PARSE_CACHE: dict[Path, tuple[int, int, list[BlogPost]]] = {}
+
+
 def parse_blog_index(archive_path: Path) -> list[BlogPost]:
-    """Parse unchained-archive.md into a list of BlogPost objects."""
+    """Parse unchained-archive.md into a list of BlogPost objects.
+
+    The parsed list is cached in a pickle next to the archive, keyed on the
+    archive's (mtime_ns, size), so warm calls skip the regex scan entirely;
+    repeat calls in the same process skip the unpickle as well.
+    """
     if not archive_path.exists():
         return []
 
-    text = archive_path.read_text(encoding="utf-8")
-    posts: list[BlogPost] = []
+    st = archive_path.stat()
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _PARSE_CACHE.get(archive_path)
+    if cached is not None and cached[0] == key[0] and cached[1] == key[1]:
+        return cached[2]
 
-    for match in _ENTRY_RE.finditer(text):
-        title = match.group(1).strip()
-        url = match.group(2).strip()
-        date = (match.group(3) or "").strip()
-        full_content = match.group(4).strip()
-        excerpt = full_content[:300]
-        posts.append(BlogPost(title=title, url=url, date=date, excerpt=excerpt, full_content=full_content))
+    cache_path = archive_path.with_suffix(".cache.pkl")
+    try:
+        with open(cache_path, "rb") as f:
+            cached_key, posts = pickle.load(f)
+        if cached_key == key:
+            _PARSE_CACHE[archive_path] = (*key, posts)
+            return posts
+    except Exception:  # noqa: BLE001 — any corrupt/stale cache means re-parse
+        pass
 
+    posts = list(iter_blog_index(archive_path))
+    try:
+        tmp_path = cache_path.with_suffix(".tmp")
+        with open(tmp_path, "wb") as f:
+            pickle.dump((key, posts), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        logger.debug("Could not write archive parse cache to %s", cache_path)
+    _PARSE_CACHE[archive_path] = (*key, posts)
     return posts
+
+
+# Same identity-keyed memo pattern as labs_manager.lab_index.
+_POST_INDEX_MEMO: tuple[list[BlogPost], dict[str, BlogPost]] | None = None
+
+
+def post_index(posts: list[BlogPost]) -> dict[str, BlogPost]:
+    """Return {post.url: post}, reused across calls for the same posts list."""
+    global _POST_INDEX_MEMO
+    memo = _POST_INDEX_MEMO
+    if memo is not None and memo[0] is posts:
+        return memo[1]
+    index = {p.url: p for p in posts}
+    _POST_INDEX_MEMO = (posts, index)
+    return index
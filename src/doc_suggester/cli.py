@@ -3,11 +3,14 @@
 from __future__ import annotations
 
 import argparse
-import asyncio
 import logging
 import sys
 from pathlib import Path
 
+# asyncio and the suggester (which pulls in anthropic + mcp) are imported
+# inside main() only once we know a run is actually happening, keeping
+# --help and argument errors fast.
+
 
 def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(
@@ -31,6 +34,16 @@ def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
         action="store_true",
         help="Force blog archive refresh regardless of staleness.",
     )
+    parser.add_argument(
+        "--stop-daemon",
+        action="store_true",
+        help="Stop the warm docs MCP container and exit.",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Skip the on-disk suggestion cache and always run a fresh analysis.",
+    )
     parser.add_argument(
         "--notes-file",
         metavar="FILE",
@@ -73,6 +86,12 @@ def main(argv: list[str] | None = None) -> None:
         format="%(levelname)s %(name)s: %(message)s",
     )
 
+    if args.stop_daemon:
+        from doc_suggester.docs_daemon import stop_daemon
+
+        stop_daemon()
+        return
+
     # Resolve SE notes text
     if args.notes_file:
         notes = Path(args.notes_file).read_text(encoding="utf-8").strip()
@@ -90,6 +109,22 @@ def main(argv: list[str] | None = None) -> None:
 
     project_root = _resolve_project_root(args.project_root)
 
+    cache = None
+    if not args.no_cache:
+        from doc_suggester.semantic_cache import SuggestionCache
+
+        cache = SuggestionCache(project_root)
+        if args.refresh:
+            # Forced refresh changes the source content, so drop stale results.
+            cache.clear()
+        else:
+            cached = cache.get(notes, args.format)
+            if cached is not None:
+                print(cached)
+                return
+
+    import asyncio
+
     from doc_suggester.suggester import suggest
 
     result = asyncio.run(suggest(
@@ -97,7 +132,10 @@ def main(argv: list[str] | None = None) -> None:
         project_root=project_root,
         force_refresh=args.refresh,
         output_format=args.format,
+        use_cache=not args.no_cache,
     ))
+    if cache is not None:
+        cache.put(notes, args.format, result)
     print(result)
 
 
@@ -2,21 +2,32 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import json
 import logging
 import os
 import sys
+from collections.abc import Sequence
 from contextlib import AsyncExitStack
 from typing import Any
 
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
 
+from doc_suggester import docs_daemon
+
 logger = logging.getLogger(__name__)
 
 _DOCKER_IMAGE = "ghcr.io/chainguard-dev/ai-docs:latest"
 
 
+@functools.lru_cache(maxsize=1)
+def _devnull() -> Any:
+    """Shared write handle to /dev/null, opened once per process."""
+    return open(os.devnull, "w")
+
+
 class DocsClient:
     """Async context manager that opens a single Docker MCP subprocess."""
 
@@ -26,20 +37,23 @@ class DocsClient:
         self._cache: dict[str, str] = {}
 
     async def __aenter__(self) -> "DocsClient":
-        server_params = StdioServerParameters(
-            command="docker",
-            args=["run", "--rm", "-i", _DOCKER_IMAGE, "serve-mcp"],
-        )
+        # ensure_daemon shells out to docker (and the first run may pull the
+        # image); thread it so concurrent loop work isn't frozen meanwhile.
+        if await asyncio.to_thread(docs_daemon.ensure_daemon, _DOCKER_IMAGE):
+            # Attach to the warm container — skips container startup entirely.
+            args = ["exec", "-i", docs_daemon.CONTAINER_NAME, "serve-mcp"]
+        else:
+            args = ["run", "--rm", "-i", _DOCKER_IMAGE, "serve-mcp"]
+        server_params = StdioServerParameters(command="docker", args=args)
         # Route subprocess stderr to /dev/null unless DEBUG logging is active.
-        # (anyio requires a real file descriptor, so a Python-level wrapper won't work.)
+        # (anyio requires a real file descriptor, so a Python-level wrapper won't
+        # work.) The handle is process-shared, so it isn't closed per session.
         if logger.isEnabledFor(logging.DEBUG):
             errlog = sys.stderr
         else:
-            errlog = open(os.devnull, "w")
+            errlog = _devnull()
 
         async with AsyncExitStack() as stack:
-            if errlog is not sys.stderr:
-                stack.callback(errlog.close)
             logger.debug("Starting MCP docs server via Docker")
             read, write = await stack.enter_async_context(stdio_client(server_params, errlog=errlog))
             session = await stack.enter_async_context(ClientSession(read, write))
@@ -55,15 +69,15 @@ class DocsClient:
 
     def _extract_text(self, result: Any) -> str:
         """Extract text content from an MCP tool result."""
-        if hasattr(result, "content"):
-            parts = []
-            for item in result.content:
-                if hasattr(item, "text"):
-                    parts.append(item.text)
-                elif isinstance(item, dict) and "text" in item:
-                    parts.append(item["text"])
-            return "\n".join(parts)
-        return str(result)
+        content = getattr(result, "content", None)
+        if content is None:
+            return str(result)
+        return "\n".join(
+            text
+            for item in content
+            if (text := getattr(item, "text", None) if not isinstance(item, dict) else item.get("text"))
+            is not None
+        )
 
     async def _call_tool(self, name: str, arguments: dict[str, Any] | None = None) -> str:
         if self._session is None:
@@ -89,3 +103,30 @@ class DocsClient:
     async def get_tool_docs(self, tool_name: str) -> str:
         """Get documentation for a Chainguard tool (wolfi, apko, melange, chainctl)."""
         return await self._call_tool("get_tool_docs", {"tool_name": tool_name})
+
+    async def bulk_fetch(
+        self,
+        *,
+        images: Sequence[str] = (),
+        tools: Sequence[str] = (),
+        security: bool = False,
+    ) -> dict[str, str]:
+        """Fetch several doc types concurrently over the single MCP session.
+
+        The MCP stream multiplexes requests by ID, so the calls pipeline and
+        total wall time is the slowest round-trip rather than the sum. Failed
+        fetches are returned as error strings rather than raised, so one bad
+        doc type doesn't lose the rest.
+        """
+        keys = [f"image:{name}" for name in images] + [f"tool:{name}" for name in tools]
+        coros = [self.get_image_docs(name) for name in images]
+        coros += [self.get_tool_docs(name) for name in tools]
+        if security:
+            keys.append("security")
+            coros.append(self.get_security_docs())
+
+        results = await asyncio.gather(*coros, return_exceptions=True)
+        return {
+            key: f"Error fetching docs: {result}" if isinstance(result, BaseException) else result
+            for key, result in zip(keys, results)
+        }
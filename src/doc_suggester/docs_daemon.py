@@ -0,0 +1,72 @@
+"""Keeps a warm Docker container running for the docs MCP server.
+
+Cold-starting ``docker run --rm -i`` on every invocation pays image lookup
+and container startup (~1-3s) before the MCP handshake even begins. Instead,
+a named container is started detached on first use and left running; later
+invocations attach a fresh MCP server process to it with ``docker exec -i``,
+which skips container creation entirely.
+
+There is deliberately no idle shutdown: the container stays resident until
+``--stop-daemon``. One idling container is cheaper than re-paying startup on
+the next run, and a self-arming timer would need its own watchdog process.
+"""
+
+from __future__ import annotations
+
+import logging
+import subprocess
+
+logger = logging.getLogger(__name__)
+
+CONTAINER_NAME = "doc-suggester-mcp"
+
+
+def _docker(*args: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        ["docker", *args],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+
+def daemon_running() -> bool:
+    """Return True if the warm container exists and is running."""
+    try:
+        result = _docker("inspect", "-f", "{{.State.Running}}", CONTAINER_NAME)
+    except OSError:
+        return False
+    return result.returncode == 0 and result.stdout.strip() == "true"
+
+
+def ensure_daemon(image: str) -> bool:
+    """Start the warm container if needed. Returns True when it is usable."""
+    if daemon_running():
+        return True
+    try:
+        # A stopped container (host reboot, docker restart) keeps its name
+        # claimed; restart it rather than colliding with `docker run --name`.
+        if _docker("start", CONTAINER_NAME).returncode == 0:
+            logger.debug("Restarted warm MCP container %s", CONTAINER_NAME)
+            return True
+        # -i keeps stdin open so the stdio MCP server idles instead of
+        # exiting; the restart policy keeps it warm across docker restarts.
+        result = _docker(
+            "run", "-d", "-i", "--restart", "unless-stopped",
+            "--name", CONTAINER_NAME, image, "serve-mcp",
+        )
+    except OSError:
+        return False
+    if result.returncode != 0:
+        logger.debug("Could not start warm MCP container: %s", result.stderr.strip())
+        return False
+    logger.debug("Started warm MCP container %s", CONTAINER_NAME)
+    return True
+
+
+def stop_daemon() -> None:
+    """Remove the warm container, if any."""
+    try:
+        _docker("rm", "-f", CONTAINER_NAME)
+    except OSError:
+        pass
@@ -2,20 +2,30 @@
 
 from __future__ import annotations
 
-import json
+import functools
 import logging
 import subprocess
 import sys
+import time
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
 from pathlib import Path
 
+from doc_suggester import _json
+
+try:  # Optional: stream catalog entries without materializing the whole DOM
+    import ijson
+
+    _CATALOG_ERRORS: tuple[type[Exception], ...] = (ValueError, OSError, ijson.JSONError)
+except ImportError:
+    ijson = None
+    _CATALOG_ERRORS = (ValueError, OSError)
+
 logger = logging.getLogger(__name__)
 
 _LABS_STALE_DAYS = 30
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LabEntry:
     id: str
     title: str
@@ -37,30 +47,38 @@ class LabEntry:
 def is_labs_stale(project_root: Path) -> bool:
     """Return True if labs-catalog.json is missing or older than _LABS_STALE_DAYS."""
     catalog = project_root / "output" / "labs-catalog.json"
-    if not catalog.exists():
+    try:
+        st = catalog.stat()
+    except FileNotFoundError:
         return True
-    mtime = datetime.fromtimestamp(catalog.stat().st_mtime, tz=timezone.utc)
-    age = datetime.now(timezone.utc) - mtime
-    return age.days > _LABS_STALE_DAYS
+    # Raw epoch arithmetic: one stat, no datetime construction or tz dispatch.
+    return time.time() - st.st_mtime > _LABS_STALE_DAYS * 86400
 
 
-def _find_llgen() -> list[str]:
+@functools.lru_cache(maxsize=1)
+def _find_llgen() -> tuple[str, ...]:
     """Return the command to invoke llgen.
 
     Prefers the binary bundled at install time. Falls back to `go run .`
-    for development (uv run / editable install).
+    for development (uv run / editable install). Cached so long-lived
+    processes don't repeat the stat/chmod on every refresh.
     """
     binary_name = "llgen.exe" if sys.platform == "win32" else "llgen"
     bundled = Path(__file__).parent / "bin" / binary_name
     if bundled.exists():
-        bundled.chmod(0o755)
-        return [str(bundled)]
-    return ["go", "run", "."]
+        st = bundled.stat()
+        if not st.st_mode & 0o111:
+            try:
+                bundled.chmod(st.st_mode | 0o755)
+            except OSError:
+                pass  # read-only install (EROFS/EACCES): the run itself will surface it
+        return (str(bundled),)
+    return ("go", "run", ".")
 
 
 def refresh_labs(project_root: Path, force: bool = False) -> None:
     """Run llgen to refresh the labs catalog."""
-    cmd = _find_llgen()
+    cmd = list(_find_llgen())
     args = [
         "--output-dir", str(project_root / "output"),
         "--cache-dir", str(project_root / "llgen-cache"),
@@ -69,7 +87,7 @@ def refresh_labs(project_root: Path, force: bool = False) -> None:
     if force:
         args.append("--force")
     # go run . requires cwd to be the Go source dir; the precompiled binary does not
-    cwd = project_root / "llgen" if cmd == ["go", "run", "."] else project_root
+    cwd = project_root / "llgen" if cmd[0] == "go" else project_root
     logger.debug("Running llgen: %s %s (cwd=%s)", cmd, args, cwd)
     sink = sys.stderr if logger.isEnabledFor(logging.DEBUG) else subprocess.DEVNULL
     try:
@@ -79,92 +97,192 @@ def refresh_labs(project_root: Path, force: bool = False) -> None:
             check=True,
             stdout=sink,
             stderr=sink,
+            # Lets CPython use posix_spawn instead of fork+exec, which avoids
+            # copying this process's page tables just to launch llgen. Safe:
+            # we don't hold inheritable fds beyond the standard streams.
+            close_fds=False,
         )
     except subprocess.CalledProcessError:
         logger.warning("llgen failed — using existing labs-catalog.json")
 
 
+def _iter_catalog_entries(catalog_path: Path):
+    """Yield raw lab entry dicts, streaming through ijson when available.
+
+    Streaming keeps peak allocations proportional to the largest single
+    entry rather than the whole catalog.
+    """
+    if ijson is not None:
+        with open(catalog_path, "rb") as f:
+            yield from ijson.items(f, "labs.item")
+    else:
+        data = _json.loads(catalog_path.read_bytes())
+        yield from data.get("labs", [])
+
+
+_EMPTY_LIST: list = []  # shared read-only default for absent catalog fields
+
+
+def _lst(entry: dict, key: str) -> list:
+    """Like entry.get(key, []) without allocating a fresh [] per call."""
+    v = entry.get(key)
+    return v if v else _EMPTY_LIST
+
+
+# Parsed catalogs keyed by path; the (mtime_ns, size) pair is the version tag,
+# so a rewritten catalog invalidates its entry with zero staleness window.
+_LABS_CACHE: dict[Path, tuple[int, int, list[LabEntry]]] = {}
+
+
 def load_labs(catalog_path: Path) -> list[LabEntry]:
-    """Parse labs-catalog.json into a list of LabEntry objects."""
-    if not catalog_path.exists():
-        return []
+    """Parse labs-catalog.json into a list of LabEntry objects.
 
+    Warm calls in the same process return the cached list as long as the
+    file's mtime and size are unchanged.
+    """
     try:
-        data = json.loads(catalog_path.read_text(encoding="utf-8"))
-    except (json.JSONDecodeError, OSError):
+        st = catalog_path.stat()
+    except FileNotFoundError:
         return []
 
+    cached = _LABS_CACHE.get(catalog_path)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+
     labs: list[LabEntry] = []
-    for entry in data.get("labs", []):
-        recording_url = entry.get("recording_url") or ""
-        lab_page_url = entry.get("lab_page_url") or ""
-        url = lab_page_url if lab_page_url else recording_url
-        if not url:
-            continue
-        labs.append(LabEntry(
-            id=entry.get("id", ""),
-            title=entry.get("title", ""),
-            date=entry.get("date", ""),
-            url=url,
-            recording_url=recording_url,
-            technologies=entry.get("technologies", []),
-            chainguard_products=entry.get("chainguard_products", []),
-            difficulty=entry.get("difficulty", ""),
-            intent_signals=entry.get("intent_signals", []),
-            summary=entry.get("summary", ""),
-            what_you_build=entry.get("what_you_build", ""),
-            problems_addressed=entry.get("problems_addressed", []),
-            prerequisites=entry.get("prerequisites", []),
-            personas=entry.get("personas", []),
-            related_labs=entry.get("related_labs", []),
-        ))
+    try:
+        for entry in _iter_catalog_entries(catalog_path):
+            recording_url = entry.get("recording_url") or ""
+            lab_page_url = entry.get("lab_page_url") or ""
+            url = lab_page_url if lab_page_url else recording_url
+            if not url:
+                continue
+            labs.append(LabEntry(
+                id=entry.get("id", ""),
+                title=entry.get("title", ""),
+                date=entry.get("date", ""),
+                url=url,
+                recording_url=recording_url,
+                technologies=_lst(entry, "technologies"),
+                chainguard_products=_lst(entry, "chainguard_products"),
+                difficulty=entry.get("difficulty", ""),
+                intent_signals=_lst(entry, "intent_signals"),
+                summary=entry.get("summary", ""),
+                what_you_build=entry.get("what_you_build", ""),
+                problems_addressed=_lst(entry, "problems_addressed"),
+                prerequisites=_lst(entry, "prerequisites"),
+                personas=_lst(entry, "personas"),
+                related_labs=_lst(entry, "related_labs"),
+            ))
+    except _CATALOG_ERRORS:
+        return []
+    _LABS_CACHE[catalog_path] = (st.st_mtime_ns, st.st_size, labs)
     return labs
 
 
+# Identity-keyed memo: load_labs returns the same cached list object while
+# the catalog is unchanged, so the derived index is rebuilt only when the
+# list itself changes.
+_LAB_INDEX_MEMO: tuple[list[LabEntry], dict[str, LabEntry]] | None = None
+
+
+def lab_index(labs: list[LabEntry]) -> dict[str, LabEntry]:
+    """Return {lab.id: lab}, reused across calls for the same labs list."""
+    global _LAB_INDEX_MEMO
+    memo = _LAB_INDEX_MEMO
+    if memo is not None and memo[0] is labs:
+        return memo[1]
+    index = {lab.id: lab for lab in labs}
+    _LAB_INDEX_MEMO = (labs, index)
+    return index
+
+
 def build_labs_index_text(labs: list[LabEntry]) -> str:
     """Build a compact index string for the LLM prompt."""
     if not labs:
         return ""
-    lines = ["## Learning Labs Index\n"]
+    # One composed f-string per lab instead of ~6 list appends each.
+    blocks = []
     for lab in labs:
-        tech_str = ", ".join(lab.technologies) if lab.technologies else ""
-        signals_str = ", ".join(lab.intent_signals[:6]) if lab.intent_signals else ""
-        lines.append(f"- **{lab.title}** ({lab.date}) [{lab.difficulty}]")
-        lines.append(f"  ID: {lab.id} | URL: {lab.url}")
-        if tech_str:
-            lines.append(f"  Technologies: {tech_str}")
-        if signals_str:
-            lines.append(f"  Signals: {signals_str}")
+        block = (
+            f"- **{lab.title}** ({lab.date}) [{lab.difficulty}]\n"
+            f"  ID: {lab.id} | URL: {lab.url}"
+        )
+        if lab.technologies:
+            block += f"\n  Technologies: {', '.join(lab.technologies)}"
+        if lab.intent_signals:
+            block += f"\n  Signals: {', '.join(lab.intent_signals[:6])}"
         if lab.summary:
-            lines.append(f"  Summary: {lab.summary[:200]}")
-        lines.append("")
-    return "\n".join(lines)
+            block += f"\n  Summary: {lab.summary[:200]}"
+        blocks.append(block)
+    return "## Learning Labs Index\n\n" + "\n\n".join(blocks) + "\n"
+
+
+_LABS_INDEX_CACHE: dict[Path, tuple[int, int, str]] = {}
+
+
+def load_labs_index_text(catalog_path: Path, labs: list[LabEntry]) -> str:
+    """Return the labs index prompt text, cached alongside the catalog.
+
+    The rendered index only changes when the catalog does, so it is cached in
+    memory keyed by the catalog's stat (like _LABS_CACHE) and mirrored to
+    output/labs-index.txt so fresh processes skip the rebuild as well.
+    """
+    if not labs:
+        return ""
+    try:
+        st = catalog_path.stat()
+    except FileNotFoundError:
+        return build_labs_index_text(labs)
+
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _LABS_INDEX_CACHE.get(catalog_path)
+    if cached is not None and cached[0] == key[0] and cached[1] == key[1]:
+        return cached[2]
+
+    index_path = catalog_path.with_name("labs-index.txt")
+    try:
+        if index_path.stat().st_mtime_ns >= st.st_mtime_ns:
+            text = index_path.read_text(encoding="utf-8")
+            _LABS_INDEX_CACHE[catalog_path] = (*key, text)
+            return text
+    except OSError:
+        pass
+
+    text = build_labs_index_text(labs)
+    try:
+        index_path.write_text(text, encoding="utf-8")
+    except OSError:
+        logger.debug("Could not write labs index cache to %s", index_path)
+    _LABS_INDEX_CACHE[catalog_path] = (*key, text)
+    return text
 
 
 def format_lab_detail(lab: LabEntry) -> str:
     """Format a single lab's full details for tool result text."""
-    lines = [f"# {lab.title}", f"**ID**: {lab.id}", f"**Date**: {lab.date}",
-             f"**Difficulty**: {lab.difficulty}", f"**URL**: {lab.url}"]
+    text = (
+        f"# {lab.title}\n**ID**: {lab.id}\n**Date**: {lab.date}\n"
+        f"**Difficulty**: {lab.difficulty}\n**URL**: {lab.url}"
+    )
     if lab.recording_url and lab.recording_url != lab.url:
-        lines.append(f"**Recording**: {lab.recording_url}")
+        text += f"\n**Recording**: {lab.recording_url}"
     if lab.technologies:
-        lines.append(f"**Technologies**: {', '.join(lab.technologies)}")
+        text += f"\n**Technologies**: {', '.join(lab.technologies)}"
     if lab.chainguard_products:
-        lines.append(f"**Chainguard products**: {', '.join(lab.chainguard_products)}")
+        text += f"\n**Chainguard products**: {', '.join(lab.chainguard_products)}"
     if lab.personas:
-        lines.append(f"**Personas**: {', '.join(lab.personas)}")
+        text += f"\n**Personas**: {', '.join(lab.personas)}"
     if lab.summary:
-        lines.append(f"\n**Summary**: {lab.summary}")
+        text += f"\n\n**Summary**: {lab.summary}"
     if lab.what_you_build:
-        lines.append(f"\n**What you build**: {lab.what_you_build}")
+        text += f"\n\n**What you build**: {lab.what_you_build}"
     if lab.problems_addressed:
-        lines.append("\n**Problems addressed**:")
-        for p in lab.problems_addressed:
-            lines.append(f"- {p}")
+        problems = "\n".join(f"- {p}" for p in lab.problems_addressed)
+        text += f"\n\n**Problems addressed**:\n{problems}"
     if lab.prerequisites:
-        lines.append(f"\n**Prerequisites**: {', '.join(lab.prerequisites)}")
+        text += f"\n\n**Prerequisites**: {', '.join(lab.prerequisites)}"
     if lab.intent_signals:
-        lines.append(f"\n**Intent signals**: {', '.join(lab.intent_signals)}")
+        text += f"\n\n**Intent signals**: {', '.join(lab.intent_signals)}"
     if lab.related_labs:
-        lines.append(f"\n**Related labs**: {', '.join(lab.related_labs)}")
-    return "\n".join(lines)
+        text += f"\n\n**Related labs**: {', '.join(lab.related_labs)}"
+    return text
@@ -0,0 +1,20 @@
+"""Process-wide Anthropic client shared by suggest() and synopsis generation."""
+
+from __future__ import annotations
+
+import anthropic
+
+_client: anthropic.AsyncAnthropic | None = None
+
+
+def get_client() -> anthropic.AsyncAnthropic:
+    """Return the process-wide Anthropic client, created on first use.
+
+    Sharing one client keeps the underlying HTTP connection pool (and its
+    TLS session) warm across suggest() and generate_synopses() calls in
+    long-lived processes.
+    """
+    global _client
+    if _client is None:
+        _client = anthropic.AsyncAnthropic()
+    return _client
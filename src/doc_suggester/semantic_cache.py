@@ -0,0 +1,84 @@
+"""On-disk cache of suggestion results, keyed by normalized SE notes."""
+
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+import string
+import time
+from pathlib import Path
+
+_TTL_SECONDS = 24 * 3600
+
+_PUNCTUATION_TABLE = str.maketrans("", "", string.punctuation)
+
+_SCHEMA = """\
+CREATE TABLE IF NOT EXISTS suggestions (
+    key TEXT PRIMARY KEY,
+    notes TEXT NOT NULL,
+    format TEXT NOT NULL,
+    result TEXT NOT NULL,
+    created_at INTEGER NOT NULL
+)
+"""
+
+
+def _cache_key(notes: str, output_format: str) -> str:
+    """Hash of the notes with case, whitespace, and punctuation normalized away.
+
+    Trivial edits (reflowed lines, stray spaces, capitalization, an added
+    period or comma) produce the same key, so a re-run of effectively
+    identical notes hits the cache without any similarity search.
+    """
+    normalized = " ".join(notes.lower().translate(_PUNCTUATION_TABLE).split())
+    return hashlib.sha256(f"{output_format}\x00{normalized}".encode()).hexdigest()
+
+
+class SuggestionCache:
+    """Maps (SE notes, output format) to a previously generated result.
+
+    Entries expire after 24 hours so recommendations track a refreshed
+    archive; `clear()` drops everything when the caller forces a refresh.
+    """
+
+    def __init__(self, project_root: Path, ttl: int = _TTL_SECONDS) -> None:
+        db_path = project_root / "output" / "suggestion-cache.sqlite3"
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(db_path)
+        self._conn.execute(_SCHEMA)
+        self._conn.commit()
+        self._ttl = ttl
+
+    def get(self, notes: str, output_format: str) -> str | None:
+        """Return the cached result for these notes, or None on miss/expiry."""
+        row = self._conn.execute(
+            "SELECT result, created_at FROM suggestions WHERE key = ?",
+            (_cache_key(notes, output_format),),
+        ).fetchone()
+        if row is None:
+            return None
+        result, created_at = row
+        if time.time() - created_at > self._ttl:
+            return None
+        return result
+
+    def put(self, notes: str, output_format: str, result: str) -> None:
+        """Store a freshly generated result, pruning expired rows as we go."""
+        self._conn.execute(
+            "DELETE FROM suggestions WHERE created_at < ?",
+            (int(time.time()) - self._ttl,),
+        )
+        self._conn.execute(
+            "INSERT OR REPLACE INTO suggestions (key, notes, format, result, created_at)"
+            " VALUES (?, ?, ?, ?, ?)",
+            (_cache_key(notes, output_format), notes, output_format, result, int(time.time())),
+        )
+        self._conn.commit()
+
+    def clear(self) -> None:
+        """Drop all entries — used when the blog archive is force-refreshed."""
+        self._conn.execute("DELETE FROM suggestions")
+        self._conn.commit()
+
+    def close(self) -> None:
+        self._conn.close()
@@ -3,21 +3,35 @@
 from __future__ import annotations
 
 import asyncio
+import functools
+import hashlib
+import json
+import pickle
+import sqlite3
 import sys
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
-import anthropic
-
-from doc_suggester.blog_manager import BlogPost, is_archive_stale, parse_blog_index, refresh_blogs
+from doc_suggester.blog_manager import (
+    BlogPost,
+    is_archive_stale,
+    parse_blog_index,
+    post_index,
+    refresh_blogs,
+)
 from doc_suggester.synopsis_generator import _url_to_slug, generate_synopses
 from doc_suggester.docs_client import DocsClient
+from doc_suggester.llm import get_client
 from doc_suggester.labs_manager import (
     LabEntry,
-    build_labs_index_text,
     format_lab_detail,
     is_labs_stale,
+    lab_index,
     load_labs,
+    load_labs_index_text,
     refresh_labs,
 )
 
@@ -63,7 +77,10 @@ If no conflicts: end with `*No content conflicts detected.*`
 _PROMPTS_DIR = Path(__file__).parent / "prompts"
 
 
+@functools.cache
 def _build_system_prompt(output_format: str) -> str:
+    # Cached per format: skips the email_format.txt read and the large
+    # base+format concatenation on every suggest() call.
     if output_format == "email":
         fmt = (_PROMPTS_DIR / "email_format.txt").read_text(encoding="utf-8")
     else:
@@ -139,6 +156,68 @@ _TOOLS: list[dict[str, Any]] = [
 ]
 
 
+_RESPONSE_CACHE_TTL = 24 * 3600
+
+_RESPONSE_SCHEMA = """\
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    response BLOB NOT NULL,
+    created_at INTEGER NOT NULL
+)
+"""
+
+
+class _ResponseCache:
+    """Exact-request cache for messages.create, in output/llm-cache.sqlite3.
+
+    Keyed by a hash of the full request payload, so replaying identical
+    turns (dev loops, CI reruns against an unchanged archive) returns the
+    pickled response without an API round-trip. Same sqlite/TTL pattern as
+    semantic_cache.SuggestionCache, one level down the stack.
+    """
+
+    def __init__(self, project_root: Path, ttl: int = _RESPONSE_CACHE_TTL) -> None:
+        db_path = project_root / "output" / "llm-cache.sqlite3"
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(db_path)
+        self._conn.execute(_RESPONSE_SCHEMA)
+        self._conn.commit()
+        self._ttl = ttl
+
+    @staticmethod
+    def key(request: dict[str, Any]) -> str:
+        payload = json.dumps(request, sort_keys=True, default=repr)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def get(self, key: str) -> Any | None:
+        row = self._conn.execute(
+            "SELECT response, created_at FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None or time.time() - row[1] > self._ttl:
+            return None
+        try:
+            return pickle.loads(row[0])
+        except Exception:  # noqa: BLE001 — any stale/corrupt blob means miss
+            return None
+
+    def put(self, key: str, response: Any) -> None:
+        try:
+            blob = pickle.dumps(response, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:  # noqa: BLE001 — unpicklable responses just skip the cache
+            return
+        self._conn.execute(
+            "DELETE FROM responses WHERE created_at < ?", (int(time.time()) - self._ttl,)
+        )
+        self._conn.execute(
+            "INSERT OR REPLACE INTO responses (key, response, created_at) VALUES (?, ?, ?)",
+            (key, blob, int(time.time())),
+        )
+        self._conn.commit()
+
+    def close(self) -> None:
+        self._conn.close()
+
+
 def _status(msg: str) -> None:
     print(msg, file=sys.stderr, flush=True)
 
@@ -160,45 +239,76 @@ def _format_tool_status(tool_name: str, tool_input: dict[str, Any]) -> str:
 
 
 def _build_blog_index_text(posts: list[BlogPost], synopses: dict[str, str] = {}) -> str:
-    lines = ["## Blog Index\n"]
+    if not posts:
+        return "## Blog Index\n"
+    # One composed f-string per post instead of four list appends each.
+    blocks = []
     for post in posts:
         date_part = f" | {post.date}" if post.date else ""
-        lines.append(f"- **{post.title}**{date_part}")
-        lines.append(f"  URL: {post.url}")
-        slug = _url_to_slug(post.url)
-        blurb = synopses.get(slug) or post.excerpt[:200]
-        lines.append(f"  Synopsis: {blurb}")
-        lines.append("")
-    return "\n".join(lines)
-
-
-async def _dispatch_tool(
-    tool_name: str,
-    tool_input: dict[str, Any],
-    post_by_url: dict[str, BlogPost],
-    docs: DocsClient,
-    lab_by_id: dict[str, LabEntry],
-) -> str:
-    if tool_name == "get_blog_post":
-        url = tool_input.get("url", "")
-        post = post_by_url.get(url)
-        return post.full_content if post else f"Blog post not found in archive: {url}"
-    if tool_name == "search_docs":
-        return await docs.search(
-            query=tool_input["query"],
-            max_results=tool_input.get("max_results", 5),
-        )
-    if tool_name == "get_security_docs":
-        return await docs.get_security_docs()
-    if tool_name == "get_tool_docs":
-        return await docs.get_tool_docs(tool_input["tool_name"])
-    if tool_name == "get_image_docs":
-        return await docs.get_image_docs(tool_input["image_name"])
-    if tool_name == "get_lab":
-        lab_id = tool_input.get("lab_id", "")
-        lab = lab_by_id.get(lab_id)
-        return format_lab_detail(lab) if lab else f"Lab not found: {lab_id}"
-    return f"Unknown tool: {tool_name}"
+        blurb = synopses.get(_url_to_slug(post.url)) or post.excerpt[:200]
+        blocks.append(f"- **{post.title}**{date_part}\n  URL: {post.url}\n  Synopsis: {blurb}")
+    return "## Blog Index\n\n" + "\n\n".join(blocks) + "\n"
+
+
+@dataclass(slots=True)
+class _ToolContext:
+    """Per-session state the tool handlers close over."""
+
+    post_by_url: dict[str, BlogPost]
+    docs: DocsClient
+    lab_by_id: dict[str, LabEntry]
+
+
+async def _handle_blog_post(tool_input: dict[str, Any], ctx: _ToolContext) -> str:
+    url = tool_input.get("url", "")
+    post = ctx.post_by_url.get(url)
+    return post.full_content if post else f"Blog post not found in archive: {url}"
+
+
+async def _handle_search_docs(tool_input: dict[str, Any], ctx: _ToolContext) -> str:
+    return await ctx.docs.search(
+        query=tool_input["query"],
+        max_results=tool_input.get("max_results", 5),
+    )
+
+
+async def _handle_security_docs(tool_input: dict[str, Any], ctx: _ToolContext) -> str:
+    return await ctx.docs.get_security_docs()
+
+
+async def _handle_tool_docs(tool_input: dict[str, Any], ctx: _ToolContext) -> str:
+    return await ctx.docs.get_tool_docs(tool_input["tool_name"])
+
+
+async def _handle_image_docs(tool_input: dict[str, Any], ctx: _ToolContext) -> str:
+    return await ctx.docs.get_image_docs(tool_input["image_name"])
+
+
+async def _handle_lab(tool_input: dict[str, Any], ctx: _ToolContext) -> str:
+    lab_id = tool_input.get("lab_id", "")
+    lab = ctx.lab_by_id.get(lab_id)
+    return format_lab_detail(lab) if lab else f"Lab not found: {lab_id}"
+
+
+_HANDLERS: dict[str, Callable[[dict[str, Any], _ToolContext], Awaitable[str]]] = {
+    "get_blog_post": _handle_blog_post,
+    "search_docs": _handle_search_docs,
+    "get_security_docs": _handle_security_docs,
+    "get_tool_docs": _handle_tool_docs,
+    "get_image_docs": _handle_image_docs,
+    "get_lab": _handle_lab,
+}
+
+
+async def _dispatch_tool(tool_name: str, tool_input: dict[str, Any], ctx: _ToolContext) -> str:
+    handler = _HANDLERS.get(tool_name)
+    if handler is None:
+        return f"Unknown tool: {tool_name}"
+    return await handler(tool_input, ctx)
+
+
+# Single-flight map: concurrent identical suggest() calls share one task.
+_INFLIGHT: dict[str, asyncio.Task[str]] = {}
 
 
 async def suggest(
@@ -206,6 +316,7 @@ async def suggest(
     project_root: Path,
     force_refresh: bool = False,
     output_format: str = "md",
+    use_cache: bool = True,
 ) -> str:
     """Generate content recommendations for SE notes.
 
@@ -214,34 +325,61 @@ async def suggest(
         project_root: Path to the doc-suggester repo root (contains main.go).
         force_refresh: If True, run the Go scraper regardless of archive age.
         output_format: "md" for ranked markdown (default), "email" for a follow-up email draft.
+        use_cache: If False, skip cached API-response replays (--no-cache).
 
     Returns:
         Formatted recommendations in the requested format.
     """
-    # 1. Refresh blogs if needed
+    # Coalesce concurrent identical calls (e.g. a double-submitted web
+    # request) onto one in-flight task so duplicates don't hit the API.
+    key = hashlib.sha256(
+        f"{output_format}\x00{force_refresh}\x00{use_cache}\x00{project_root}\x00{se_notes}".encode()
+    ).hexdigest()
+    task = _INFLIGHT.get(key)
+    if task is None:
+        task = asyncio.create_task(
+            _suggest(se_notes, project_root, force_refresh, output_format, use_cache)
+        )
+        _INFLIGHT[key] = task
+        task.add_done_callback(lambda _: _INFLIGHT.pop(key, None))
+    return await task
+
+
+async def _suggest(
+    se_notes: str,
+    project_root: Path,
+    force_refresh: bool,
+    output_format: str,
+    use_cache: bool,
+) -> str:
+    # 1–2. Refresh blogs and labs if needed. The scraper and llgen hit
+    # different upstreams, so stale refreshes run concurrently.
+    refreshes = []
     if force_refresh or is_archive_stale(project_root):
         _status("Refreshing blog archive...")
-        refresh_blogs(project_root, force=force_refresh)
-
-    # 2. Refresh labs if needed
+        refreshes.append(asyncio.to_thread(refresh_blogs, project_root, force=force_refresh))
     if force_refresh or is_labs_stale(project_root):
         _status("Refreshing labs catalog...")
-        refresh_labs(project_root, force=force_refresh)
+        refreshes.append(asyncio.to_thread(refresh_labs, project_root, force=force_refresh))
+    if refreshes:
+        await asyncio.gather(*refreshes)
 
-    # 3. Parse blog index
+    # 3. Parse blog index (loaders stay sync; threads keep the loop free
+    # for concurrent LLM calls during cold-cache reads)
     archive_path = project_root / "output" / "unchained-archive.md"
-    posts = parse_blog_index(archive_path)
+    posts = await asyncio.to_thread(parse_blog_index, archive_path)
     synopses = await generate_synopses(project_root, posts)
     blog_index_text = _build_blog_index_text(posts, synopses)
-    post_by_url = {p.url: p for p in posts}
+    post_by_url = post_index(posts)
 
     # 4. Parse labs catalog
-    labs = load_labs(project_root / "output" / "labs-catalog.json")
-    lab_by_id = {lab.id: lab for lab in labs}
-    labs_index_text = build_labs_index_text(labs)
+    catalog_path = project_root / "output" / "labs-catalog.json"
+    labs = await asyncio.to_thread(load_labs, catalog_path)
+    lab_by_id = lab_index(labs)
+    labs_index_text = await asyncio.to_thread(load_labs_index_text, catalog_path, labs)
 
     # 5. Run multi-turn tool use with a single DocsClient session
-    client = anthropic.AsyncAnthropic()
+    client = get_client()
     system_prompt = _build_system_prompt(output_format)
     user_content = f"SE notes about prospect:\n\n{se_notes}\n\n{blog_index_text}"
     if labs_index_text:
@@ -253,35 +391,46 @@ async def suggest(
         }
     ]
 
-    async with DocsClient() as docs:
-        for _ in range(_MAX_TURNS):
-            _status("Thinking...")
-            response = await client.messages.create(
-                model=_MODEL,
-                max_tokens=4096,
-                system=system_prompt,
-                tools=_TOOLS,
-                messages=messages,
-            )
-
-            messages.append({"role": "assistant", "content": response.content})
-
-            if response.stop_reason != "tool_use":
-                break
-
-            tool_use_blocks = [b for b in response.content if b.type == "tool_use"]
-            for block in tool_use_blocks:
-                _status(_format_tool_status(block.name, block.input))
-
-            async def _dispatch_block(block: Any) -> dict[str, Any]:
-                return {
-                    "type": "tool_result",
-                    "tool_use_id": block.id,
-                    "content": await _dispatch_tool(block.name, block.input, post_by_url, docs, lab_by_id),
+    cache = _ResponseCache(project_root)
+    try:
+        async with DocsClient() as docs:
+            ctx = _ToolContext(post_by_url=post_by_url, docs=docs, lab_by_id=lab_by_id)
+            for _ in range(_MAX_TURNS):
+                _status("Thinking...")
+                request: dict[str, Any] = {
+                    "model": _MODEL,
+                    "max_tokens": 4096,
+                    "system": system_prompt,
+                    "tools": _TOOLS,
+                    "messages": messages,
                 }
-
-            tool_results = list(await asyncio.gather(*map(_dispatch_block, tool_use_blocks)))
-            messages.append({"role": "user", "content": tool_results})
+                cache_key = _ResponseCache.key(request)
+                # force_refresh and --no-cache both mean fresh output, not a replay.
+                replay = use_cache and not force_refresh
+                response = cache.get(cache_key) if replay else None
+                if response is None:
+                    response = await client.messages.create(**request)
+                    cache.put(cache_key, response)
+
+                messages.append({"role": "assistant", "content": response.content})
+
+                if response.stop_reason != "tool_use":
+                    break
+
+                tool_use_blocks = [b for b in response.content if b.type == "tool_use"]
+                for block in tool_use_blocks:
+                    _status(_format_tool_status(block.name, block.input))
+
+                results = await asyncio.gather(
+                    *(_dispatch_tool(b.name, b.input, ctx) for b in tool_use_blocks)
+                )
+                tool_results: list[dict[str, Any]] = [
+                    {"type": "tool_result", "tool_use_id": b.id, "content": content}
+                    for b, content in zip(tool_use_blocks, results)
+                ]
+                messages.append({"role": "user", "content": tool_results})
+    finally:
+        cache.close()
 
     # Extract final text response
     for block in response.content:
@@ -3,88 +3,310 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import functools
 import logging
 import sys
+import time
 from pathlib import Path
 
 import anthropic
 
+from doc_suggester import _json
 from doc_suggester.blog_manager import BlogPost
+from doc_suggester.llm import get_client
 
 logger = logging.getLogger(__name__)
 
 _MODEL = "claude-haiku-4-5-20251001"
 _CONCURRENCY = 10
 
-_SYNOPSES_PATH = Path("output") / "blog-synopses.json"
+# Self-throttle below the account's requests-per-minute limit: a 429 retry
+# costs a full backoff window, waiting for a token costs only the deficit.
+_REQUESTS_PER_MINUTE = 50
 
 
+class _TokenBucket:
+    """asyncio-friendly token bucket refilling continuously at rate/60 per second.
+
+    Starts full, so bursts up to the per-minute rate pass untouched; beyond
+    that, acquire() sleeps just long enough for the deficit to refill. Clock
+    and sleep are injectable for tests.
+    """
+
+    def __init__(
+        self,
+        rate_per_minute: float,
+        clock=time.monotonic,
+        sleep=asyncio.sleep,
+    ):
+        self._capacity = float(rate_per_minute)
+        self._refill_per_second = rate_per_minute / 60.0
+        self._tokens = self._capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._last = clock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(
+            self._capacity, self._tokens + (now - self._last) * self._refill_per_second
+        )
+        self._last = now
+
+    async def acquire(self, tokens: float = 1.0) -> None:
+        while True:
+            self._refill()
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return
+            await self._sleep((tokens - self._tokens) / self._refill_per_second)
+
+
+# Below this many missing posts, per-request latency beats batch polling.
+_BATCH_THRESHOLD = 20
+_BATCH_POLL_SECONDS = 5
+# The Batches API may take hours; suggest() is interactive, so give up and
+# fall back to concurrent per-post requests well before that.
+_BATCH_POLL_TIMEOUT = 300
+
+_SYNOPSES_PATH = Path("output") / "blog-synopses.jsonl"
+_LEGACY_SYNOPSES_PATH = Path("output") / "blog-synopses.json"
+
+
+@functools.lru_cache(maxsize=None)
 def _url_to_slug(url: str) -> str:
-    """Extract slug from URL — matches checkpoint.json key format."""
+    """Extract slug from URL — matches checkpoint.json key format.
+
+    Cached: the same post URLs are re-slugged on every suggest() call (index
+    build, missing-synopsis filter, result keying) in long-lived processes.
+    """
     return url.rstrip("/").rsplit("/", 1)[-1]
 
 
+# Same (mtime_ns, size)-tagged cache pattern as labs_manager._LABS_CACHE.
+_SYNOPSES_CACHE: dict[Path, tuple[int, int, dict[str, str]]] = {}
+
+
 def load_synopses(project_root: Path) -> dict[str, str]:
-    """Read output/blog-synopses.json; returns {} if missing or corrupt."""
+    """Read output/blog-synopses.jsonl; returns {} if missing or corrupt.
+
+    The store is one {"slug", "synopsis"} object per line so new entries can
+    be appended without rewriting the file. Falls back to the legacy
+    blog-synopses.json when no JSONL file exists yet. Warm calls in the same
+    process skip the re-parse while the file's mtime and size are unchanged.
+    """
     path = project_root / _SYNOPSES_PATH
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
-    except (FileNotFoundError, json.JSONDecodeError):
+        st = path.stat()
+    except FileNotFoundError:
+        try:
+            return _json.loads((project_root / _LEGACY_SYNOPSES_PATH).read_bytes())
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    cached = _SYNOPSES_CACHE.get(path)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+
+    synopses: dict[str, str] = {}
+    try:
+        for line in path.read_bytes().splitlines():
+            if line:
+                entry = _json.loads(line)
+                synopses[entry["slug"]] = entry["synopsis"]
+    except (ValueError, KeyError):
         return {}
+    _SYNOPSES_CACHE[path] = (st.st_mtime_ns, st.st_size, synopses)
+    return synopses
+
+
+# How much post content to embed in a synopsis prompt, in characters.
+_SYNOPSIS_INPUT_CHARS = 3000
+
+_SYNOPSIS_PROMPT_PREFIX = (
+    "Generate an information-retrieval synopsis for this Chainguard blog post.\n"
+    "Output ONLY the synopsis — no preamble or explanation.\n"
+    "Format: semicolon-separated key topics, technologies, problems addressed, and use cases.\n"
+    "Target: 100–150 characters.\n\n"
+)
+
+
+def _synopsis_prompt(post: BlogPost) -> str:
+    return (
+        f"{_SYNOPSIS_PROMPT_PREFIX}Title: {post.title}\n\n"
+        f"Content:\n{post.full_content[:_SYNOPSIS_INPUT_CHARS]}"
+    )
+
+
+def _first_text(content) -> str | None:
+    return next((b.text for b in content if hasattr(b, "text")), None)
+
+
+# Word-set Jaccard at or above this counts as the same post lightly edited.
+_DUPLICATE_JACCARD = 0.9
+
+
+def _fingerprint(post: BlogPost) -> frozenset[str]:
+    return frozenset(f"{post.title} {post.excerpt}".lower().split())
+
+
+def _jaccard(a: frozenset[str], b: frozenset[str]) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+def _reuse_near_duplicate_synopses(
+    posts: list[BlogPost], missing: list[BlogPost], synopses: dict[str, str]
+) -> tuple[list[BlogPost], list[tuple[str, str]]]:
+    """Copy synopses onto near-duplicates of already-summarized posts.
+
+    A re-published or lightly edited post shares almost all of its
+    title+excerpt word set with the original, so it borrows that synopsis
+    instead of paying for a fresh API call. Returns the posts still missing
+    a synopsis and the (slug, synopsis) pairs copied.
+    """
+    have = [
+        (_url_to_slug(p.url), _fingerprint(p))
+        for p in posts
+        if _url_to_slug(p.url) in synopses
+    ]
+    if not have:
+        return missing, []
+    still_missing: list[BlogPost] = []
+    copied: list[tuple[str, str]] = []
+    for post in missing:
+        fp = _fingerprint(post)
+        match = next(
+            (slug for slug, other in have if _jaccard(fp, other) >= _DUPLICATE_JACCARD),
+            None,
+        )
+        if match is not None:
+            slug = _url_to_slug(post.url)
+            synopses[slug] = synopses[match]
+            copied.append((slug, synopses[match]))
+        else:
+            still_missing.append(post)
+    return still_missing, copied
+
+
+def _append_entries(path: Path, entries) -> None:
+    with open(path, "ab") as f:
+        for slug, synopsis in entries:
+            f.write(_json.dumps({"slug": slug, "synopsis": synopsis}) + b"\n")
+
+
+async def _generate_batched(
+    client: anthropic.AsyncAnthropic, missing: list[BlogPost]
+) -> list[tuple[str, str | None]]:
+    """Generate synopses via the Message Batches API — one job, not N round-trips.
+
+    Raises TimeoutError (after requesting cancellation) if the batch hasn't
+    ended within _BATCH_POLL_TIMEOUT, so the caller can fall back to the
+    per-post path instead of hanging an interactive run.
+    """
+    batch = await client.messages.batches.create(
+        requests=[
+            {
+                "custom_id": _url_to_slug(post.url),
+                "params": {
+                    "model": _MODEL,
+                    "max_tokens": 200,
+                    "messages": [{"role": "user", "content": _synopsis_prompt(post)}],
+                },
+            }
+            for post in missing
+        ]
+    )
+    deadline = time.monotonic() + _BATCH_POLL_TIMEOUT
+    while batch.processing_status != "ended":
+        if time.monotonic() >= deadline:
+            await client.messages.batches.cancel(batch.id)
+            raise TimeoutError(
+                f"Batch {batch.id} did not finish within {_BATCH_POLL_TIMEOUT}s"
+            )
+        await asyncio.sleep(_BATCH_POLL_SECONDS)
+        batch = await client.messages.batches.retrieve(batch.id)
+
+    results: list[tuple[str, str | None]] = []
+    async for entry in await client.messages.batches.results(batch.id):
+        if entry.result.type == "succeeded":
+            results.append((entry.custom_id, _first_text(entry.result.message.content)))
+        else:
+            logger.warning("Batch synopsis failed for %s: %s", entry.custom_id, entry.result.type)
+            results.append((entry.custom_id, None))
+    return results
 
 
 async def generate_synopses(project_root: Path, posts: list[BlogPost]) -> dict[str, str]:
     """Generate and cache synopses for posts that don't have one yet.
 
-    Returns the full synopses dict (existing + newly generated).
+    Returns the full synopses dict (existing + newly generated). Large
+    backfills go through the Message Batches API (one job, half the cost);
+    small top-ups use concurrent per-post requests to avoid batch polling
+    latency.
     """
-    synopses = load_synopses(project_root)
+    synopses = await asyncio.to_thread(load_synopses, project_root)
     missing = [p for p in posts if _url_to_slug(p.url) not in synopses]
 
     if not missing:
         return synopses
 
+    path = project_root / _SYNOPSES_PATH
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if not path.exists() and synopses:
+        # Seed the JSONL with legacy-JSON contents before the first append.
+        _append_entries(path, synopses.items())
+
+    missing, copied = _reuse_near_duplicate_synopses(posts, missing, synopses)
+    if copied:
+        _append_entries(path, copied)
+    if not missing:
+        return synopses
+
     print(f"Generating synopses for {len(missing)} posts (this may take a minute on first run)...", file=sys.stderr, flush=True)
-    client = anthropic.AsyncAnthropic()
+    client = get_client()
     semaphore = asyncio.Semaphore(_CONCURRENCY)
+    bucket = _TokenBucket(_REQUESTS_PER_MINUTE)
+    write_lock = asyncio.Lock()
+
+    async def _persist(slug: str, synopsis: str) -> None:
+        # Checkpoint each completion: a crash mid-run keeps finished work.
+        async with write_lock:
+            await asyncio.to_thread(_append_entries, path, [(slug, synopsis)])
 
     async def _generate_one(post: BlogPost) -> tuple[str, str | None]:
         slug = _url_to_slug(post.url)
-        prompt = (
-            "Generate an information-retrieval synopsis for this Chainguard blog post.\n"
-            "Output ONLY the synopsis — no preamble or explanation.\n"
-            "Format: semicolon-separated key topics, technologies, problems addressed, and use cases.\n"
-            "Target: 100–150 characters.\n\n"
-            f"Title: {post.title}\n\n"
-            f"Content:\n{post.full_content[:3000]}"
-        )
         async with semaphore:
+            await bucket.acquire()
             try:
                 response = await client.messages.create(
                     model=_MODEL,
                     max_tokens=200,
-                    messages=[{"role": "user", "content": prompt}],
+                    messages=[{"role": "user", "content": _synopsis_prompt(post)}],
                 )
-                text = next(
-                    (b.text for b in response.content if hasattr(b, "text")), None
-                )
-                return slug, text
+                text = _first_text(response.content)
             except Exception as exc:
                 logger.warning("Failed to generate synopsis for %s: %s", slug, exc)
                 return slug, None
+        if text:
+            await _persist(slug, text)
+        return slug, text
 
-    results = await asyncio.gather(*(_generate_one(p) for p in missing))
+    if len(missing) >= _BATCH_THRESHOLD:
+        try:
+            results = await _generate_batched(client, missing)
+            await asyncio.to_thread(
+                _append_entries, path, [(s, t) for s, t in results if t]
+            )
+        except Exception as exc:
+            logger.warning("Batch synopsis generation failed, falling back: %s", exc)
+            results = await asyncio.gather(*(_generate_one(p) for p in missing))
+    else:
+        results = await asyncio.gather(*(_generate_one(p) for p in missing))
 
     for slug, synopsis in results:
         if synopsis:
             synopses[slug] = synopsis
 
-    path = project_root / _SYNOPSES_PATH
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(
-        json.dumps(dict(sorted(synopses.items())), indent=2, ensure_ascii=False),
-        encoding="utf-8",
-    )
-
     return synopses
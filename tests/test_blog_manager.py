@@ -5,9 +5,11 @@ from __future__ import annotations
 import json
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
+from doc_suggester import blog_manager
 from doc_suggester.blog_manager import (
     BlogPost,
     _parse_date,
@@ -17,27 +19,32 @@ from doc_suggester.blog_manager import (
 )
 
 
-# ─── _parse_date ─────────────────────────────────────────────────────────────
-
-
-def test_parse_date_full_month_name():
-    result = _parse_date("January 5, 2024")
-    assert result == datetime(2024, 1, 5, tzinfo=timezone.utc)
-
-
-def test_parse_date_padded_day():
-    result = _parse_date("March 15, 2023")
-    assert result == datetime(2023, 3, 15, tzinfo=timezone.utc)
+def _write_output(tmp_path: Path, checkpoint: dict | None = None, archive: str | None = None) -> None:
+    """Create output/ and write the requested files in one place."""
+    output = tmp_path / "output"
+    output.mkdir(exist_ok=True)
+    if archive is not None:
+        (output / "unchained-archive.md").write_text(archive)
+    if checkpoint is not None:
+        (output / "checkpoint.json").write_text(json.dumps(checkpoint))
 
 
-def test_parse_date_iso_format():
-    result = _parse_date("2024-06-01")
-    assert result == datetime(2024, 6, 1, tzinfo=timezone.utc)
+# ─── _parse_date ─────────────────────────────────────────────────────────────
 
 
-def test_parse_date_invalid():
-    assert _parse_date("not a date") is None
-    assert _parse_date("") is None
+@pytest.mark.parametrize(
+    ("date_str", "expected"),
+    [
+        ("January 5, 2024", datetime(2024, 1, 5, tzinfo=timezone.utc)),
+        ("March 15, 2023", datetime(2023, 3, 15, tzinfo=timezone.utc)),
+        ("2024-06-01", datetime(2024, 6, 1, tzinfo=timezone.utc)),
+        ("december 1, 2020", datetime(2020, 12, 1, tzinfo=timezone.utc)),
+        ("not a date", None),
+        ("", None),
+    ],
+)
+def test_parse_date(date_str: str, expected: datetime | None):
+    assert _parse_date(date_str) == expected
 
 
 # ─── get_most_recent_blog_date ────────────────────────────────────────────────
@@ -48,33 +55,27 @@ def test_get_most_recent_blog_date_no_checkpoint(tmp_path: Path):
 
 
 def test_get_most_recent_blog_date_empty_checkpoint(tmp_path: Path):
-    output = tmp_path / "output"
-    output.mkdir()
-    (output / "checkpoint.json").write_text("{}")
+    _write_output(tmp_path, checkpoint={})
     assert get_most_recent_blog_date(tmp_path) is None
 
 
 def test_get_most_recent_blog_date_returns_latest(tmp_path: Path):
-    output = tmp_path / "output"
-    output.mkdir()
     checkpoint = {
         "post-a": {"title": "A", "url": "https://example.com/a", "date": "January 5, 2024", "scraped_at": ""},
         "post-b": {"title": "B", "url": "https://example.com/b", "date": "March 20, 2024", "scraped_at": ""},
         "post-c": {"title": "C", "url": "https://example.com/c", "date": "February 10, 2024", "scraped_at": ""},
     }
-    (output / "checkpoint.json").write_text(json.dumps(checkpoint))
+    _write_output(tmp_path, checkpoint=checkpoint)
     result = get_most_recent_blog_date(tmp_path)
     assert result == datetime(2024, 3, 20, tzinfo=timezone.utc)
 
 
 def test_get_most_recent_blog_date_skips_missing_dates(tmp_path: Path):
-    output = tmp_path / "output"
-    output.mkdir()
     checkpoint = {
         "post-a": {"title": "A", "url": "https://example.com/a", "date": "", "scraped_at": ""},
         "post-b": {"title": "B", "url": "https://example.com/b", "date": "June 1, 2023", "scraped_at": ""},
     }
-    (output / "checkpoint.json").write_text(json.dumps(checkpoint))
+    _write_output(tmp_path, checkpoint=checkpoint)
     result = get_most_recent_blog_date(tmp_path)
     assert result == datetime(2023, 6, 1, tzinfo=timezone.utc)
 
@@ -87,16 +88,11 @@ def test_is_archive_stale_no_archive(tmp_path: Path):
 
 
 def test_is_archive_stale_no_checkpoint(tmp_path: Path):
-    output = tmp_path / "output"
-    output.mkdir()
-    (output / "unchained-archive.md").write_text("# archive")
+    _write_output(tmp_path, archive="# archive")
     assert is_archive_stale(tmp_path) is True
 
 
 def test_is_archive_stale_recent(tmp_path: Path):
-    output = tmp_path / "output"
-    output.mkdir()
-    (output / "unchained-archive.md").write_text("# archive")
     recent_date = datetime.now(timezone.utc) - timedelta(days=2)
     checkpoint = {
         "post-a": {
@@ -106,14 +102,11 @@ def test_is_archive_stale_recent(tmp_path: Path):
             "scraped_at": "",
         }
     }
-    (output / "checkpoint.json").write_text(json.dumps(checkpoint))
+    _write_output(tmp_path, checkpoint=checkpoint, archive="# archive")
     assert is_archive_stale(tmp_path) is False
 
 
 def test_is_archive_stale_old(tmp_path: Path):
-    output = tmp_path / "output"
-    output.mkdir()
-    (output / "unchained-archive.md").write_text("# archive")
     old_date = datetime.now(timezone.utc) - timedelta(days=30)
     checkpoint = {
         "post-a": {
@@ -123,7 +116,7 @@ def test_is_archive_stale_old(tmp_path: Path):
             "scraped_at": "",
         }
     }
-    (output / "checkpoint.json").write_text(json.dumps(checkpoint))
+    _write_output(tmp_path, checkpoint=checkpoint, archive="# archive")
     assert is_archive_stale(tmp_path) is True
 
 
@@ -164,18 +157,29 @@ Content without a date.
 """
 
 
-def test_parse_blog_index_returns_posts(tmp_path: Path):
-    archive = tmp_path / "unchained-archive.md"
-    archive.write_text(_SAMPLE_ARCHIVE)
-    posts = parse_blog_index(archive)
-    assert len(posts) == 3
+_SAMPLE_ARCHIVE_BYTES = _SAMPLE_ARCHIVE.encode()
 
 
-def test_parse_blog_index_fields(tmp_path: Path):
-    archive = tmp_path / "unchained-archive.md"
-    archive.write_text(_SAMPLE_ARCHIVE)
-    posts = parse_blog_index(archive)
-    first = posts[0]
+@pytest.fixture(scope="session")
+def sample_archive_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Sample archive written once per session — tests must not mutate it."""
+    archive = tmp_path_factory.mktemp("archive") / "unchained-archive.md"
+    archive.write_bytes(_SAMPLE_ARCHIVE_BYTES)
+    return archive
+
+
+@pytest.fixture(scope="session")
+def parsed_sample_posts(sample_archive_path: Path) -> list[BlogPost]:
+    """Sample archive parsed once per session for read-only assertions."""
+    return parse_blog_index(sample_archive_path)
+
+
+def test_parse_blog_index_returns_posts(parsed_sample_posts: list[BlogPost]):
+    assert len(parsed_sample_posts) == 3
+
+
+def test_parse_blog_index_fields(parsed_sample_posts: list[BlogPost]):
+    first = parsed_sample_posts[0]
     assert first.title == "Zero CVEs in Production Java"
     assert first.url == "https://chainguard.dev/unchained/zero-cve-java"
     assert first.date == "March 15, 2024"
@@ -183,11 +187,8 @@ def test_parse_blog_index_fields(tmp_path: Path):
     assert len(first.excerpt) <= 300
 
 
-def test_parse_blog_index_no_date_post(tmp_path: Path):
-    archive = tmp_path / "unchained-archive.md"
-    archive.write_text(_SAMPLE_ARCHIVE)
-    posts = parse_blog_index(archive)
-    no_date = next(p for p in posts if p.title == "No-date post")
+def test_parse_blog_index_no_date_post(parsed_sample_posts: list[BlogPost]):
+    no_date = next(p for p in parsed_sample_posts if p.title == "No-date post")
     assert no_date.date == ""
 
 
@@ -196,6 +197,20 @@ def test_parse_blog_index_missing_file(tmp_path: Path):
     assert posts == []
 
 
+def test_parse_blog_index_uses_pickle_cache(tmp_path: Path):
+    """A process-cold repeat call loads the pickle instead of re-scanning."""
+    archive = tmp_path / "unchained-archive.md"
+    archive.write_bytes(_SAMPLE_ARCHIVE_BYTES)
+    first = parse_blog_index(archive)
+    assert archive.with_suffix(".cache.pkl").exists()
+
+    blog_manager._PARSE_CACHE.clear()  # simulate a fresh process
+    with patch.object(blog_manager, "iter_blog_index") as mock_scan:
+        second = parse_blog_index(archive)
+    mock_scan.assert_not_called()
+    assert second == first
+
+
 def test_parse_blog_index_excerpt_truncated(tmp_path: Path):
     long_content = "x" * 1000
     archive_text = f"""\
@@ -0,0 +1,57 @@
+"""Tests for DocsClient.bulk_fetch (mocked MCP session)."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+from doc_suggester.docs_client import DocsClient
+
+
+def _result(text: str) -> SimpleNamespace:
+    return SimpleNamespace(content=[SimpleNamespace(text=text)])
+
+
+def _make_client(call_tool) -> DocsClient:
+    """DocsClient wired to a fake session, skipping the Docker handshake."""
+    client = DocsClient()
+    session = AsyncMock()
+    session.call_tool = AsyncMock(side_effect=call_tool)
+    client._session = session
+    return client
+
+
+async def test_bulk_fetch_returns_all_doc_types():
+    async def _call_tool(name, arguments=None):
+        if name == "get_image_docs":
+            return _result(f"docs for {arguments['image_name']}")
+        if name == "get_tool_docs":
+            return _result(f"docs for {arguments['tool_name']}")
+        return _result("security docs")
+
+    client = _make_client(_call_tool)
+    results = await client.bulk_fetch(images=["python", "nginx"], tools=["apko"], security=True)
+    assert results == {
+        "image:python": "docs for python",
+        "image:nginx": "docs for nginx",
+        "tool:apko": "docs for apko",
+        "security": "security docs",
+    }
+
+
+async def test_bulk_fetch_maps_failures_to_error_strings():
+    """One failed fetch becomes an error string without losing the rest."""
+    async def _call_tool(name, arguments=None):
+        if name == "get_image_docs":
+            raise RuntimeError("boom")
+        return _result("tool docs")
+
+    client = _make_client(_call_tool)
+    results = await client.bulk_fetch(images=["python"], tools=["apko"])
+    assert results["image:python"] == "Error fetching docs: boom"
+    assert results["tool:apko"] == "tool docs"
+
+
+async def test_bulk_fetch_empty_request():
+    client = _make_client(AsyncMock())
+    assert await client.bulk_fetch() == {}
@@ -0,0 +1,78 @@
+"""Tests for the warm docs-daemon container management (mocked docker CLI)."""
+
+from __future__ import annotations
+
+import subprocess
+from unittest.mock import patch
+
+from doc_suggester import docs_daemon
+
+
+def _proc(returncode: int = 0, stdout: str = "") -> subprocess.CompletedProcess:
+    return subprocess.CompletedProcess(args=["docker"], returncode=returncode, stdout=stdout, stderr="")
+
+
+# ─── daemon_running ──────────────────────────────────────────────────────────
+
+
+def test_daemon_running_true():
+    with patch.object(docs_daemon, "_docker", return_value=_proc(stdout="true\n")):
+        assert docs_daemon.daemon_running() is True
+
+
+def test_daemon_running_missing_container():
+    with patch.object(docs_daemon, "_docker", return_value=_proc(returncode=1)):
+        assert docs_daemon.daemon_running() is False
+
+
+def test_daemon_running_no_docker():
+    with patch.object(docs_daemon, "_docker", side_effect=OSError):
+        assert docs_daemon.daemon_running() is False
+
+
+# ─── ensure_daemon ───────────────────────────────────────────────────────────
+
+
+def test_ensure_daemon_already_running():
+    with patch.object(docs_daemon, "_docker", return_value=_proc(stdout="true")) as mock_docker:
+        assert docs_daemon.ensure_daemon("image:latest") is True
+    mock_docker.assert_called_once()
+
+
+def test_ensure_daemon_restarts_stopped_container():
+    """A stopped container (e.g. after host reboot) is restarted, not re-created."""
+    def _fake(*args):
+        if args[0] == "inspect":
+            return _proc(stdout="false")
+        assert args == ("start", docs_daemon.CONTAINER_NAME)
+        return _proc()
+
+    with patch.object(docs_daemon, "_docker", side_effect=_fake):
+        assert docs_daemon.ensure_daemon("image:latest") is True
+
+
+def test_ensure_daemon_creates_container():
+    """With no existing container, a detached run with a restart policy is issued."""
+    calls: list[tuple[str, ...]] = []
+
+    def _fake(*args):
+        calls.append(args)
+        if args[0] in ("inspect", "start"):
+            return _proc(returncode=1)
+        return _proc()
+
+    with patch.object(docs_daemon, "_docker", side_effect=_fake):
+        assert docs_daemon.ensure_daemon("image:latest") is True
+    assert calls[-1][0] == "run"
+    assert "image:latest" in calls[-1]
+    assert "--restart" in calls[-1]
+
+
+def test_ensure_daemon_run_failure():
+    with patch.object(docs_daemon, "_docker", return_value=_proc(returncode=1)):
+        assert docs_daemon.ensure_daemon("image:latest") is False
+
+
+def test_ensure_daemon_no_docker():
+    with patch.object(docs_daemon, "_docker", side_effect=OSError):
+        assert docs_daemon.ensure_daemon("image:latest") is False
@@ -14,6 +14,7 @@ from doc_suggester.labs_manager import (
     build_labs_index_text,
     is_labs_stale,
     load_labs,
+    load_labs_index_text,
 )
 
 # ─── helpers ─────────────────────────────────────────────────────────────────
@@ -39,10 +40,25 @@ _SAMPLE_ENTRY = {
 }
 
 
-def _make_catalog(tmp_path: Path, entries: list[dict]) -> Path:
+# Serialized and encoded once at import: most tests write this exact catalog.
+_SAMPLE_CATALOG_BYTES = json.dumps({"labs": [_SAMPLE_ENTRY]}).encode()
+
+
+def _make_catalog(tmp_path: Path, entries: list[dict] | None = None) -> Path:
+    """Write a catalog under tmp_path; entries=None writes the sample one."""
     catalog = tmp_path / "output" / "labs-catalog.json"
     catalog.parent.mkdir(parents=True, exist_ok=True)
-    catalog.write_text(json.dumps({"labs": entries}))
+    catalog.write_bytes(
+        _SAMPLE_CATALOG_BYTES if entries is None else json.dumps({"labs": entries}).encode()
+    )
+    return catalog
+
+
+@pytest.fixture(scope="session")
+def sample_catalog(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Sample catalog written once per session — tests must not mutate it."""
+    catalog = tmp_path_factory.mktemp("catalog") / "labs-catalog.json"
+    catalog.write_bytes(_SAMPLE_CATALOG_BYTES)
     return catalog
 
 
@@ -77,9 +93,8 @@ def test_load_labs_missing_file(tmp_path: Path):
     assert result == []
 
 
-def test_load_labs_parses_entry(tmp_path: Path):
-    catalog = _make_catalog(tmp_path, [_SAMPLE_ENTRY])
-    labs = load_labs(catalog)
+def test_load_labs_parses_entry(sample_catalog: Path):
+    labs = load_labs(sample_catalog)
     assert len(labs) == 1
     lab = labs[0]
     assert lab.id == "ll202509"
@@ -93,9 +108,8 @@ def test_load_labs_parses_entry(tmp_path: Path):
     assert lab.related_labs == ["ll202508"]
 
 
-def test_load_labs_prefers_lab_page_url(tmp_path: Path):
-    catalog = _make_catalog(tmp_path, [_SAMPLE_ENTRY])
-    labs = load_labs(catalog)
+def test_load_labs_prefers_lab_page_url(sample_catalog: Path):
+    labs = load_labs(sample_catalog)
     assert labs[0].url == "https://edu.chainguard.dev/software-security/learning-labs/ll202509/"
 
 
@@ -121,6 +135,19 @@ def test_build_labs_index_text_empty():
     assert result == ""
 
 
+def test_load_labs_index_text_caches_to_disk(tmp_path: Path):
+    catalog = _make_catalog(tmp_path)
+    labs = load_labs(catalog)
+    text = load_labs_index_text(catalog, labs)
+    index_path = catalog.with_name("labs-index.txt")
+    assert index_path.exists()
+    assert index_path.read_text() == text
+
+
+def test_load_labs_index_text_empty_labs(tmp_path: Path):
+    assert load_labs_index_text(tmp_path / "output" / "labs-catalog.json", []) == ""
+
+
 def test_build_labs_index_text_includes_fields():
     lab = LabEntry(
         id="ll202509",
@@ -0,0 +1,16 @@
+"""Tests for the shared Anthropic client singleton."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from doc_suggester import llm
+
+
+def test_get_client_is_reused():
+    """Repeated calls construct the AsyncAnthropic client at most once."""
+    with patch.object(llm, "_client", None), patch.object(llm.anthropic, "AsyncAnthropic") as mock_cls:
+        first = llm.get_client()
+        second = llm.get_client()
+    assert first is second
+    mock_cls.assert_called_once()
@@ -0,0 +1,54 @@
+"""Tests for semantic_cache module."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from doc_suggester.semantic_cache import SuggestionCache
+
+
+def test_get_miss_returns_none(tmp_path: Path):
+    cache = SuggestionCache(tmp_path)
+    assert cache.get("prospect worried about CVEs", "md") is None
+
+
+def test_put_then_get_hit(tmp_path: Path):
+    cache = SuggestionCache(tmp_path)
+    cache.put("prospect worried about CVEs", "md", "## Recommendations")
+    assert cache.get("prospect worried about CVEs", "md") == "## Recommendations"
+
+
+def test_get_normalizes_whitespace_and_case(tmp_path: Path):
+    cache = SuggestionCache(tmp_path)
+    cache.put("Prospect worried about CVEs", "md", "## Recommendations")
+    assert cache.get("  prospect   worried\nabout cves ", "md") == "## Recommendations"
+
+
+def test_get_ignores_punctuation_edits(tmp_path: Path):
+    cache = SuggestionCache(tmp_path)
+    cache.put("prospect worried about CVEs", "md", "## Recommendations")
+    assert cache.get("prospect, worried about CVEs.", "md") == "## Recommendations"
+
+
+def test_get_is_scoped_by_format(tmp_path: Path):
+    cache = SuggestionCache(tmp_path)
+    cache.put("some notes", "md", "markdown result")
+    assert cache.get("some notes", "email") is None
+
+
+def test_expired_entry_misses(tmp_path: Path):
+    cache = SuggestionCache(tmp_path, ttl=0)
+    cache.put("some notes", "md", "stale result")
+    assert cache.get("some notes", "md") is None
+
+
+def test_clear_drops_entries(tmp_path: Path):
+    cache = SuggestionCache(tmp_path)
+    cache.put("some notes", "md", "result")
+    cache.clear()
+    assert cache.get("some notes", "md") is None
+
+
+def test_cache_persists_across_instances(tmp_path: Path):
+    SuggestionCache(tmp_path).put("some notes", "md", "result")
+    assert SuggestionCache(tmp_path).get("some notes", "md") == "result"
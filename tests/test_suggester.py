@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
+from contextlib import contextmanager
 from pathlib import Path
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
@@ -37,39 +40,55 @@ def _make_archive(tmp_path: Path) -> None:
     (output / "checkpoint.json").write_text(json.dumps(checkpoint))
 
 
-def _make_text_block(text: str) -> MagicMock:
-    block = MagicMock()
-    block.type = "text"
-    block.text = text
-    return block
+# Plain namespaces instead of MagicMock: the suggester only reads attributes
+# off response/content objects, and SimpleNamespace skips the per-attribute
+# child-mock machinery.
 
 
-def _make_tool_use_block(tool_id: str, name: str, input_data: dict) -> MagicMock:
-    block = MagicMock()
-    block.type = "tool_use"
-    block.id = tool_id
-    block.name = name
-    block.input = input_data
-    return block
+def _make_text_block(text: str) -> SimpleNamespace:
+    return SimpleNamespace(type="text", text=text)
 
 
-def _make_end_response(text: str = "Recommendations") -> MagicMock:
-    response = MagicMock()
-    response.stop_reason = "end_turn"
-    response.content = [_make_text_block(text)]
-    return response
+def _make_tool_use_block(tool_id: str, name: str, input_data: dict) -> SimpleNamespace:
+    return SimpleNamespace(type="tool_use", id=tool_id, name=name, input=input_data)
 
 
-def _make_tool_response(block: MagicMock) -> MagicMock:
-    response = MagicMock()
-    response.stop_reason = "tool_use"
-    response.content = [block]
-    return response
+def _make_end_response(text: str = "Recommendations") -> SimpleNamespace:
+    return SimpleNamespace(stop_reason="end_turn", content=[_make_text_block(text)])
 
 
-@pytest.fixture
+def _make_tool_response(*blocks: SimpleNamespace) -> SimpleNamespace:
+    return SimpleNamespace(stop_reason="tool_use", content=list(blocks))
+
+
+class FakeAnthropicClient:
+    """Minimal AsyncAnthropic stand-in: pops queued responses, records calls.
+
+    A hand-rolled coroutine skips AsyncMock's call-recording machinery on
+    every await; call kwargs land in messages.calls with the messages list
+    snapshotted at call time.
+    """
+
+    def __init__(self, responses: tuple = ()):
+        async def create(**kwargs):
+            self.calls.append({**kwargs, "messages": list(kwargs["messages"])})
+            return self._responses.pop(0)
+
+        self.calls: list[dict] = []
+        self._responses = list(responses)
+        self.messages = SimpleNamespace(create=create, calls=self.calls)
+
+    def queue(self, *responses) -> None:
+        self._responses.extend(responses)
+
+
+@pytest.fixture(scope="module")
 def mock_docs_client():
-    """Provide a pre-configured async mock DocsClient."""
+    """Provide a pre-configured async mock DocsClient, shared per module.
+
+    Nothing mutates the configured return values, so one instance serves
+    every test; the autouse fixture below clears call counts between tests.
+    """
     client = AsyncMock()
     client.__aenter__ = AsyncMock(return_value=client)
     client.__aexit__ = AsyncMock(return_value=None)
@@ -80,22 +99,35 @@ def mock_docs_client():
     return client
 
 
-@pytest.fixture
-def suggest_env(tmp_path: Path, mock_docs_client):
-    """Archive + patched dependencies. Yields (project_root, mock_client, mock_refresh)."""
-    _make_archive(tmp_path)
+@pytest.fixture(autouse=True)
+def _reset_docs_client(mock_docs_client):
+    yield
+    mock_docs_client.reset_mock()
+
+
+@contextmanager
+def _patch_suggest(mock_docs_client, labs: list[LabEntry] | None = None):
+    """Install the common suggest() patches; yields (mock_client, mock_refresh)."""
     with (
         patch("doc_suggester.suggester.is_archive_stale", return_value=False),
         patch("doc_suggester.suggester.refresh_blogs") as mock_refresh,
         patch("doc_suggester.suggester.is_labs_stale", return_value=False),
         patch("doc_suggester.suggester.refresh_labs"),
-        patch("doc_suggester.suggester.load_labs", return_value=[]),
+        patch("doc_suggester.suggester.load_labs", return_value=labs or []),
         patch("doc_suggester.suggester.DocsClient", return_value=mock_docs_client),
-        patch("doc_suggester.suggester.anthropic.AsyncAnthropic") as mock_anthropic,
+        patch("doc_suggester.suggester.get_client") as mock_get_client,
         patch("doc_suggester.suggester.generate_synopses", new=AsyncMock(return_value={})),
     ):
-        mock_client = AsyncMock()
-        mock_anthropic.return_value = mock_client
+        mock_client = FakeAnthropicClient()
+        mock_get_client.return_value = mock_client
+        yield mock_client, mock_refresh
+
+
+@pytest.fixture
+def suggest_env(tmp_path: Path, mock_docs_client):
+    """Archive + patched dependencies. Yields (project_root, mock_client, mock_refresh)."""
+    _make_archive(tmp_path)
+    with _patch_suggest(mock_docs_client) as (mock_client, mock_refresh):
         yield tmp_path, mock_client, mock_refresh
 
 
@@ -113,14 +145,12 @@ def test_build_blog_index_text_includes_posts():
             title="Zero CVEs in Java",
             url="https://chainguard.dev/unchained/zero-cve-java",
             date="March 15, 2024",
-            excerpt="Chainguard Java images...",
             full_content="Full content here",
         ),
         BlogPost(
             title="SLSA Compliance",
             url="https://chainguard.dev/unchained/slsa",
             date="January 8, 2024",
-            excerpt="SLSA provides...",
             full_content="Full SLSA content",
         ),
     ]
@@ -139,8 +169,7 @@ def test_build_blog_index_text_uses_synopsis():
         title="Java CVEs",
         url="https://chainguard.dev/unchained/java-cves",
         date="March 1, 2024",
-        excerpt="Raw excerpt text that should not appear.",
-        full_content="Full content",
+        full_content="Raw excerpt text that should not appear.",
     )
     synopses = {"java-cves": "Java; CVEs; container security; zero vulnerabilities"}
     text = _build_blog_index_text([post], synopses)
@@ -154,8 +183,7 @@ def test_build_blog_index_text_fallback_to_excerpt():
         title="Unknown Post",
         url="https://chainguard.dev/unchained/unknown-post",
         date="March 1, 2024",
-        excerpt="This excerpt should appear as fallback.",
-        full_content="Full content",
+        full_content="This excerpt should appear as fallback.",
     )
     text = _build_blog_index_text([post], synopses={})
     assert "This excerpt should appear as fallback." in text
@@ -167,7 +195,6 @@ def test_build_blog_index_text_no_date():
             title="Undated Post",
             url="https://chainguard.dev/unchained/undated",
             date="",
-            excerpt="Some content",
             full_content="Full content",
         )
     ]
@@ -183,9 +210,7 @@ def test_build_blog_index_text_no_date():
 async def test_suggest_returns_text_response(suggest_env):
     """Single-turn response with no tool calls returns final text."""
     tmp_path, mock_client, _ = suggest_env
-    mock_client.messages.create = AsyncMock(
-        return_value=_make_end_response("## Recommendations\n\n### 1. Java CVE Post")
-    )
+    mock_client.queue(_make_end_response("## Recommendations\n\n### 1. Java CVE Post"))
     result = await suggest("prospect worried about Java CVEs", tmp_path)
     assert "Recommendations" in result
     assert "Java CVE Post" in result
@@ -197,19 +222,51 @@ async def test_suggest_handles_tool_use_loop(suggest_env):
     tool_use_block = _make_tool_use_block(
         "tu_1", "get_blog_post", {"url": "https://chainguard.dev/unchained/java-cves"}
     )
-    mock_client.messages.create = AsyncMock(side_effect=[
+    mock_client.queue(
         _make_tool_response(tool_use_block),
         _make_end_response("## Recommendations\n\n### 1. Java CVE Post\nDetailed content."),
-    ])
+    )
     result = await suggest("prospect worried about Java CVEs", tmp_path)
     assert "Recommendations" in result
-    assert mock_client.messages.create.call_count == 2
+    assert len(mock_client.messages.calls) == 2
+
+
+async def test_suggest_reuses_cached_response(suggest_env):
+    """An identical second run replays the cached response without an API call."""
+    tmp_path, mock_client, _ = suggest_env
+    mock_client.queue(_make_end_response("Cached recommendations"))
+    first = await suggest("prospect worried about Java CVEs", tmp_path)
+    second = await suggest("prospect worried about Java CVEs", tmp_path)
+    assert first == second == "Cached recommendations"
+    assert len(mock_client.messages.calls) == 1
+
+
+async def test_suggest_no_cache_skips_replay(suggest_env):
+    """use_cache=False forces a fresh API call even when a replay exists."""
+    tmp_path, mock_client, _ = suggest_env
+    mock_client.queue(_make_end_response("First"), _make_end_response("Second"))
+    first = await suggest("prospect worried about Java CVEs", tmp_path)
+    second = await suggest("prospect worried about Java CVEs", tmp_path, use_cache=False)
+    assert (first, second) == ("First", "Second")
+    assert len(mock_client.messages.calls) == 2
+
+
+async def test_suggest_deduplicates_concurrent_calls(suggest_env):
+    """Concurrent identical calls coalesce onto a single in-flight request."""
+    tmp_path, mock_client, _ = suggest_env
+    mock_client.queue(_make_end_response("Coalesced recommendations"))
+    first, second = await asyncio.gather(
+        suggest("prospect worried about Java CVEs", tmp_path),
+        suggest("prospect worried about Java CVEs", tmp_path),
+    )
+    assert first == second == "Coalesced recommendations"
+    assert len(mock_client.messages.calls) == 1
 
 
 async def test_suggest_triggers_refresh_when_stale(suggest_env):
     """When archive is stale, refresh_blogs is called."""
     tmp_path, mock_client, mock_refresh = suggest_env
-    mock_client.messages.create = AsyncMock(return_value=_make_end_response("Recommendations"))
+    mock_client.queue(_make_end_response("Recommendations"))
     with patch("doc_suggester.suggester.is_archive_stale", return_value=True):
         await suggest("some notes", tmp_path)
     mock_refresh.assert_called_once_with(tmp_path, force=False)
@@ -218,7 +275,7 @@ async def test_suggest_triggers_refresh_when_stale(suggest_env):
 async def test_suggest_force_refresh_calls_refresh(suggest_env):
     """force_refresh=True triggers refresh even when archive is fresh."""
     tmp_path, mock_client, mock_refresh = suggest_env
-    mock_client.messages.create = AsyncMock(return_value=_make_end_response("Recommendations"))
+    mock_client.queue(_make_end_response("Recommendations"))
     await suggest("some notes", tmp_path, force_refresh=True)
     mock_refresh.assert_called_once_with(tmp_path, force=True)
 
@@ -227,31 +284,63 @@ async def test_suggest_get_security_docs_tool(suggest_env, mock_docs_client):
     """Claude can call get_security_docs tool."""
     tmp_path, mock_client, _ = suggest_env
     tool_use_block = _make_tool_use_block("tu_sec", "get_security_docs", {})
-    mock_client.messages.create = AsyncMock(side_effect=[
+    mock_client.queue(
         _make_tool_response(tool_use_block),
         _make_end_response("Security recommendations"),
-    ])
+    )
     result = await suggest("prospect using Cosign", tmp_path)
     mock_docs_client.get_security_docs.assert_called_once()
     assert "Security recommendations" in result
 
 
+async def test_suggest_parallel_tool_use(suggest_env, mock_docs_client):
+    """Two tool_use blocks in one turn are dispatched concurrently."""
+    tmp_path, mock_client, _ = suggest_env
+    security_started = asyncio.Event()
+
+    async def _image_docs(image_name):
+        # Times out if dispatch ran the blocks sequentially in order.
+        await asyncio.wait_for(security_started.wait(), timeout=2)
+        return "Image docs content"
+
+    async def _security_docs():
+        security_started.set()
+        return "Security docs content"
+
+    mock_docs_client.get_image_docs.side_effect = _image_docs
+    mock_docs_client.get_security_docs.side_effect = _security_docs
+    try:
+        mock_client.queue(
+            _make_tool_response(
+                _make_tool_use_block("tu_img", "get_image_docs", {"image_name": "python"}),
+                _make_tool_use_block("tu_sec", "get_security_docs", {}),
+            ),
+            _make_end_response("Combined recommendations"),
+        )
+        result = await suggest("prospect comparing images", tmp_path)
+    finally:
+        mock_docs_client.get_image_docs.side_effect = None
+        mock_docs_client.get_security_docs.side_effect = None
+
+    assert "Combined recommendations" in result
+    mock_docs_client.get_image_docs.assert_called_once_with("python")
+    mock_docs_client.get_security_docs.assert_called_once()
+
+
 async def test_suggest_unknown_blog_url_returns_not_found(suggest_env):
     """Requesting a URL not in the archive returns a not-found message."""
     tmp_path, mock_client, _ = suggest_env
     tool_use_block = _make_tool_use_block(
         "tu_missing", "get_blog_post", {"url": "https://chainguard.dev/unchained/nonexistent"}
     )
-    mock_client.messages.create = AsyncMock(side_effect=[
+    mock_client.queue(
         _make_tool_response(tool_use_block),
         _make_end_response("Fallback recommendations"),
-    ])
+    )
     await suggest("some notes", tmp_path)
     # Verify the tool result message contained the "not found" text.
-    # Index [2] because the second call's messages list is [user, asst(tool_use), user(tool_results)].
-    # We can't use [-1] — mock captures a reference, and the final assistant message gets appended
-    # to the same list object after the second call completes.
-    second_call_messages = mock_client.messages.create.call_args_list[1][1]["messages"]
+    # The second call's messages list is [user, asst(tool_use), user(tool_results)].
+    second_call_messages = mock_client.messages.calls[1]["messages"]
     tool_result_message = second_call_messages[2]
     assert tool_result_message["role"] == "user"
     content = tool_result_message["content"]
@@ -273,27 +362,16 @@ async def test_suggest_get_lab_tool(tmp_path: Path, mock_docs_client):
     )
     _make_archive(tmp_path)
     tool_use_block = _make_tool_use_block("tu_lab", "get_lab", {"lab_id": "ll202509"})
-    with (
-        patch("doc_suggester.suggester.is_archive_stale", return_value=False),
-        patch("doc_suggester.suggester.refresh_blogs"),
-        patch("doc_suggester.suggester.is_labs_stale", return_value=False),
-        patch("doc_suggester.suggester.refresh_labs"),
-        patch("doc_suggester.suggester.load_labs", return_value=[sample_lab]),
-        patch("doc_suggester.suggester.DocsClient", return_value=mock_docs_client),
-        patch("doc_suggester.suggester.anthropic.AsyncAnthropic") as mock_anthropic,
-        patch("doc_suggester.suggester.generate_synopses", new=AsyncMock(return_value={})),
-    ):
-        mock_client = AsyncMock()
-        mock_anthropic.return_value = mock_client
-        mock_client.messages.create = AsyncMock(side_effect=[
+    with _patch_suggest(mock_docs_client, labs=[sample_lab]) as (mock_client, _):
+        mock_client.queue(
             _make_tool_response(tool_use_block),
             _make_end_response("Java lab recommended"),
-        ])
+        )
         result = await suggest("Java developer worried about CVEs", tmp_path)
 
     assert "Java lab recommended" in result
     # Verify the tool result sent back to Claude contains lab details
-    second_call_messages = mock_client.messages.create.call_args_list[1][1]["messages"]
+    second_call_messages = mock_client.messages.calls[1]["messages"]
     tool_result_message = second_call_messages[2]
     content = tool_result_message["content"]
     assert any("Java Zero-CVE Lab" in item.get("content", "") for item in content)
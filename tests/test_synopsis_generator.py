@@ -4,12 +4,18 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from doc_suggester.blog_manager import BlogPost
-from doc_suggester.synopsis_generator import generate_synopses, load_synopses
+from doc_suggester.synopsis_generator import (
+    _BATCH_THRESHOLD,
+    _TokenBucket,
+    generate_synopses,
+    load_synopses,
+)
 
 
 def _make_post(slug: str, title: str = "Test Post") -> BlogPost:
@@ -17,7 +23,6 @@ def _make_post(slug: str, title: str = "Test Post") -> BlogPost:
         title=title,
         url=f"https://chainguard.dev/unchained/{slug}",
         date="January 1, 2024",
-        excerpt="Some excerpt text.",
         full_content="Full post content here.",
     )
 
@@ -41,11 +46,46 @@ def test_load_synopses_missing_file(tmp_path: Path):
 def test_load_synopses_reads_file(tmp_path: Path):
     (tmp_path / "output").mkdir()
     data = {"java-cves": "CVEs; Java; container security", "slsa": "SLSA; supply chain; provenance"}
+    lines = "".join(json.dumps({"slug": s, "synopsis": t}) + "\n" for s, t in data.items())
+    (tmp_path / "output" / "blog-synopses.jsonl").write_text(lines)
+    result = load_synopses(tmp_path)
+    assert result == data
+
+
+def test_load_synopses_reads_legacy_json(tmp_path: Path):
+    """Falls back to the pre-JSONL blog-synopses.json when no JSONL exists."""
+    (tmp_path / "output").mkdir()
+    data = {"java-cves": "CVEs; Java; container security"}
     (tmp_path / "output" / "blog-synopses.json").write_text(json.dumps(data))
     result = load_synopses(tmp_path)
     assert result == data
 
 
+# ─── _TokenBucket ─────────────────────────────────────────────────────────────
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_throttles_after_burst():
+    """With rpm=2, four acquires burst twice then wait 30s per extra request."""
+    fake_now = 0.0
+    sleeps: list[float] = []
+
+    def _clock() -> float:
+        return fake_now
+
+    async def _sleep(seconds: float) -> None:
+        nonlocal fake_now
+        sleeps.append(seconds)
+        fake_now += seconds
+
+    bucket = _TokenBucket(2, clock=_clock, sleep=_sleep)
+    for _ in range(4):
+        await bucket.acquire()
+
+    assert len(sleeps) == 2
+    assert sum(sleeps) == pytest.approx(60.0)
+
+
 # ─── generate_synopses ────────────────────────────────────────────────────────
 
 
@@ -57,10 +97,10 @@ async def test_generate_synopses_no_new_posts(tmp_path: Path):
     (tmp_path / "output" / "blog-synopses.json").write_text(json.dumps(existing))
     posts = [_make_post("java-cves")]
 
-    with patch("doc_suggester.synopsis_generator.anthropic.AsyncAnthropic") as mock_cls:
+    with patch("doc_suggester.synopsis_generator.get_client") as mock_get_client:
         result = await generate_synopses(tmp_path, posts)
 
-    mock_cls.assert_not_called()
+    mock_get_client.assert_not_called()
     assert result == existing
 
 
@@ -77,18 +117,116 @@ async def test_generate_synopses_generates_missing(tmp_path: Path):
     mock_client = AsyncMock()
     mock_client.messages.create = AsyncMock(return_value=_make_api_response(new_synopsis))
 
-    with patch("doc_suggester.synopsis_generator.anthropic.AsyncAnthropic", return_value=mock_client):
+    with patch("doc_suggester.synopsis_generator.get_client", return_value=mock_client):
         result = await generate_synopses(tmp_path, posts)
 
     assert result["java-cves"] == existing["java-cves"]
     assert result["slsa"] == new_synopsis
     mock_client.messages.create.assert_called_once()
 
-    saved = json.loads((tmp_path / "output" / "blog-synopses.json").read_text())
+    # Existing entries were migrated into the JSONL and the new one appended.
+    saved = load_synopses(tmp_path)
     assert saved["slsa"] == new_synopsis
     assert saved["java-cves"] == existing["java-cves"]
 
 
+@pytest.mark.asyncio
+async def test_generate_synopses_fans_out_per_post(tmp_path: Path):
+    """Each missing post gets its own concurrent request; all land in the result."""
+    (tmp_path / "output").mkdir()
+    posts = [_make_post(f"post-{i}", f"Post {i}") for i in range(3)]
+
+    mock_client = AsyncMock()
+    mock_client.messages.create = AsyncMock(return_value=_make_api_response("topics; tech"))
+
+    with patch("doc_suggester.synopsis_generator.get_client", return_value=mock_client):
+        result = await generate_synopses(tmp_path, posts)
+
+    assert mock_client.messages.create.call_count == 3
+    assert all(result[f"post-{i}"] == "topics; tech" for i in range(3))
+
+
+def _make_batch_entry(slug: str, text: str) -> SimpleNamespace:
+    return SimpleNamespace(
+        custom_id=slug,
+        result=SimpleNamespace(
+            type="succeeded",
+            message=SimpleNamespace(content=[SimpleNamespace(text=text)]),
+        ),
+    )
+
+
+async def _aiter(items):
+    for item in items:
+        yield item
+
+
+@pytest.mark.asyncio
+async def test_generate_synopses_uses_batch_api_for_large_backfills(tmp_path: Path):
+    """At the batch threshold, one Batches job replaces per-post requests."""
+    (tmp_path / "output").mkdir()
+    posts = [_make_post(f"post-{i}", f"Post {i}") for i in range(_BATCH_THRESHOLD)]
+    entries = [_make_batch_entry(f"post-{i}", "topics; tech") for i in range(len(posts))]
+
+    mock_client = AsyncMock()
+    mock_client.messages.batches.create = AsyncMock(
+        return_value=SimpleNamespace(id="batch_1", processing_status="ended")
+    )
+    mock_client.messages.batches.results = AsyncMock(return_value=_aiter(entries))
+
+    with patch("doc_suggester.synopsis_generator.get_client", return_value=mock_client):
+        result = await generate_synopses(tmp_path, posts)
+
+    mock_client.messages.create.assert_not_called()
+    assert all(result[f"post-{i}"] == "topics; tech" for i in range(len(posts)))
+    # Batch results were persisted like per-post ones.
+    assert load_synopses(tmp_path)["post-0"] == "topics; tech"
+
+
+@pytest.mark.asyncio
+async def test_generate_synopses_batch_timeout_falls_back(tmp_path: Path, caplog):
+    """A batch that never ends is cancelled and per-post requests take over."""
+    (tmp_path / "output").mkdir()
+    posts = [_make_post(f"post-{i}", f"Post {i}") for i in range(_BATCH_THRESHOLD)]
+
+    mock_client = AsyncMock()
+    mock_client.messages.batches.create = AsyncMock(
+        return_value=SimpleNamespace(id="batch_1", processing_status="in_progress")
+    )
+    mock_client.messages.create = AsyncMock(return_value=_make_api_response("topics; tech"))
+
+    with (
+        patch("doc_suggester.synopsis_generator.get_client", return_value=mock_client),
+        patch("doc_suggester.synopsis_generator._BATCH_POLL_TIMEOUT", 0),
+        caplog.at_level("WARNING"),
+    ):
+        result = await generate_synopses(tmp_path, posts)
+
+    mock_client.messages.batches.cancel.assert_awaited_once_with("batch_1")
+    assert mock_client.messages.create.call_count == len(posts)
+    assert all(result[f"post-{i}"] == "topics; tech" for i in range(len(posts)))
+
+
+@pytest.mark.asyncio
+async def test_generate_synopses_reuses_near_duplicate(tmp_path: Path):
+    """A near-duplicate of an already-summarized post copies its synopsis."""
+    (tmp_path / "output").mkdir()
+    existing = {"java-cves": "CVEs; Java; container images"}
+    (tmp_path / "output" / "blog-synopses.json").write_text(json.dumps(existing))
+
+    # Same title and content as java-cves, re-published under a new slug.
+    posts = [_make_post("java-cves"), _make_post("java-cves-republished")]
+
+    with patch("doc_suggester.synopsis_generator.get_client") as mock_get_client:
+        result = await generate_synopses(tmp_path, posts)
+
+    mock_get_client.assert_not_called()
+    assert result["java-cves-republished"] == existing["java-cves"]
+    # The copied entry was persisted alongside the migrated one.
+    saved = load_synopses(tmp_path)
+    assert saved["java-cves-republished"] == existing["java-cves"]
+
+
 @pytest.mark.asyncio
 async def test_generate_synopses_handles_api_failure(tmp_path: Path, caplog):
     """API failure logs a warning, skips that post, saves partial results."""
@@ -110,7 +248,7 @@ async def test_generate_synopses_handles_api_failure(tmp_path: Path, caplog):
     mock_client.messages.create = AsyncMock(side_effect=_side_effect)
 
     with (
-        patch("doc_suggester.synopsis_generator.anthropic.AsyncAnthropic", return_value=mock_client),
+        patch("doc_suggester.synopsis_generator.get_client", return_value=mock_client),
         caplog.at_level("WARNING"),
     ):
         result = await generate_synopses(tmp_path, posts)
@@ -118,3 +256,5 @@ async def test_generate_synopses_handles_api_failure(tmp_path: Path, caplog):
     assert result.get("good-post") == good_synopsis
     assert "bad-post" not in result
     assert any("bad-post" in record.message for record in caplog.records)
+    # The successful synopsis was checkpointed to disk despite the failure.
+    assert load_synopses(tmp_path).get("good-post") == good_synopsis